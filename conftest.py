@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 
 import pytest
 try:
@@ -7,11 +8,33 @@ try:
 except ImportError:
     h5py = None
 
+try:
+    from google.auth.exceptions import RefreshError
+except ImportError:
+    RefreshError = OSError
+
+from msl.io.google_api import GDrive
+from msl.io.google_api import GMail
 from msl.io.google_api import GSheets
 
 os.environ['MSL_IO_RUNNING_TESTS'] = 'True'
 
 
+@lru_cache(maxsize=None)
+def _has_sheets_read_token():
+    # the token is only checked (once) when a doctest requires it
+    try:
+        GSheets(account='testing', read_only=True).close()
+    except Exception:
+        return False
+    return True
+
+
+def _skip_if_no_sheets_read_token():
+    if not _has_sheets_read_token():
+        pytest.skip('Google API tokens not available')
+
+
 @pytest.fixture(autouse=True)
 def doctest_skipif(doctest_namespace):
     # Don't want to test the output from some of the doctests if Python < 3.6
@@ -43,14 +66,62 @@ def doctest_skipif(doctest_namespace):
     else:
         h5 = lambda: None
 
-    try:
-        GSheets(account='testing', read_only=True)
-    except:
-        sheets_read_token = lambda: pytest.skip('Google API tokens not available')
-    else:
-        sheets_read_token = lambda: None
-
     doctest_namespace['SKIP_IF_PYTHON_LESS_THAN_36'] = ver
     doctest_namespace['SKIP_IF_NO_H5PY'] = h5
-    doctest_namespace['SKIP_IF_NO_GOOGLE_SHEETS_READ_TOKEN'] = sheets_read_token
+    doctest_namespace['SKIP_IF_NO_GOOGLE_SHEETS_READ_TOKEN'] = _skip_if_no_sheets_read_token
     doctest_namespace['SKIP_RUN_AS_ADMIN'] = lambda: pytest.skip('Illustrative examples')
+
+
+# all Google API tests require the necessary "token.json" file to be
+# available for a specific Google user's account, the clients are only
+# created (once per session) when a test that uses them is run
+def _connect(cls, reason, account='testing', **kwargs):
+    try:
+        client = cls(account=account, **kwargs)
+    except (OSError, RuntimeError, RefreshError):
+        # no token (and no client secrets file), the Google-API packages
+        # are not installed or the token could not be refreshed
+        pytest.skip(reason)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session')
+def dr():
+    # dr -> drive, readonly
+    yield from _connect(GDrive, 'No GDrive readonly token', read_only=True)
+
+
+@pytest.fixture(scope='session')
+def dw():
+    # dw -> drive, writable
+    yield from _connect(GDrive, 'No GDrive writable token', read_only=False)
+
+
+@pytest.fixture(scope='session')
+def sr():
+    # sr -> sheets, readonly
+    yield from _connect(GSheets, 'No GSheets readonly token', read_only=True)
+
+
+@pytest.fixture(scope='session')
+def sw():
+    # sw -> sheets, writeable
+    yield from _connect(GSheets, 'No GSheets writeable token', read_only=False)
+
+
+@pytest.fixture(scope='session')
+def gmail():
+    yield from _connect(GMail, 'No Gmail token')
+
+
+@pytest.fixture(scope='session')
+def demo_drive():
+    # a writable drive for the account that the CI demo test uses
+    yield from _connect(GDrive, 'No GDrive CI demo account token', account='demo', read_only=False)
+
+
+@pytest.fixture(scope='session')
+def demo_sheets():
+    # writeable sheets for the account that the CI demo test uses
+    yield from _connect(GSheets, 'No GSheets CI demo account token', account='demo', read_only=False)
@@ -5,6 +5,9 @@ import numpy as np
 
 from .vertex import Vertex
 
+# the attributes of a numpy.ndarray take precedence over the field names of a structured dtype
+_ndarray_attributes = frozenset(dir(np.ndarray))
+
 
 class Dataset(Vertex):
 
@@ -148,6 +151,12 @@ class Dataset(Vertex):
         self._data[item] = value
 
     def __getattr__(self, item):
+        # check for a field name first to avoid raising (and then handling)
+        # an AttributeError from the ndarray when accessing a field
+        fields = self._data.dtype.fields
+        if fields is not None and item in fields and item not in _ndarray_attributes:
+            return self._data[item]
+
         try:
             return getattr(self._data, item)
         except AttributeError as err:
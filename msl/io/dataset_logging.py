@@ -39,18 +39,22 @@ class DatasetLogging(Dataset, logging.Handler):
             The default behaviour is to append every :ref:`logging record <log-record>`
             to the :class:`~msl.io.dataset.Dataset`. This guarantees that the size of the
             :class:`~msl.io.dataset.Dataset` is equal to the number of
-            :ref:`logging records <log-record>` that were added to it. However, this behaviour
-            can decrease the performance if many :ref:`logging records <log-record>` are
-            added often because a copy of the data in the :class:`~msl.io.dataset.Dataset` is
-            created for each :ref:`logging record <log-record>` that is added. You can improve
-            the performance by specifying an initial size of the :class:`~msl.io.dataset.Dataset`
-            by including a `shape` or a `size` keyword argument. This will also automatically
-            create additional empty rows in the :class:`~msl.io.dataset.Dataset`, that is
-            proportional to the size of the :class:`~msl.io.dataset.Dataset`, if the size of the
-            :class:`~msl.io.dataset.Dataset` needs to be increased. If you do this then you will
-            want to call :meth:`.remove_empty_rows` before writing :class:`DatasetLogging` to a
-            file or interacting with the data in :class:`DatasetLogging` to remove the extra
-            rows that were created.
+            :ref:`logging records <log-record>` that were added to it. The records are
+            stored in an internal array that is over-allocated as it grows, so the data is
+            only copied to a larger array when the internal array is full. The
+            :attr:`~msl.io.dataset.Dataset.data` is a view of the rows of the internal array
+            that contain records, therefore, an array that was previously returned by
+            :attr:`~msl.io.dataset.Dataset.data` shares memory with the :class:`DatasetLogging`
+            but it does not include the records that are added afterwards. You can avoid
+            copying the data to a larger array by specifying an initial size of the
+            :class:`~msl.io.dataset.Dataset` by including a `shape` or a `size` keyword
+            argument. This will also automatically create additional empty rows in the
+            :class:`~msl.io.dataset.Dataset`, that is proportional to the size of the
+            :class:`~msl.io.dataset.Dataset`, if the size of the :class:`~msl.io.dataset.Dataset`
+            needs to be increased. If you do this then you will want to call
+            :meth:`.remove_empty_rows` before writing :class:`DatasetLogging` to a file or
+            interacting with the data in :class:`DatasetLogging` to remove the extra rows that
+            were created.
         """
         if not attributes or not all(isinstance(a, str) for a in attributes):
             raise ValueError('Must specify attribute names as strings, got: {}'.format(attributes))
@@ -60,6 +64,16 @@ class DatasetLogging(Dataset, logging.Handler):
         self._uses_asctime = 'asctime' in attributes
         self._date_fmt = date_fmt
 
+        # the asctime value only changes once per second, except for the microseconds, so
+        # the parts of date_fmt that are between the %f directives are formatted once per
+        # second (an escaped %% is not split correctly, so it is always fully formatted)
+        if date_fmt and '%%' not in date_fmt:
+            self._date_fmt_parts = date_fmt.split('%f')
+        else:
+            self._date_fmt_parts = None
+        self._asctime_second = None
+        self._asctime_parts = None
+
         if isinstance(level, str):
             level = getattr(logging, level)
 
@@ -87,6 +101,8 @@ class DatasetLogging(Dataset, logging.Handler):
         Dataset.__init__(self, name, parent, False, dtype=self._dtype, **kwargs)
 
         self._index = np.count_nonzero(self._data)
+        self._buffer = np.empty((0,), dtype=self._dtype)
+        self._view = None
         if self._auto_resize and self._data.shape < kwargs['shape']:
             self._resize(new_allocated=kwargs['shape'][0])
 
@@ -177,29 +193,55 @@ class DatasetLogging(Dataset, logging.Handler):
         """Overrides the :meth:`~logging.Handler.emit` method."""
         record.message = record.getMessage()
         if self._uses_asctime:
-            record.asctime = datetime.fromtimestamp(record.created).strftime(self._date_fmt)
-        latest = tuple(record.__dict__[a] for a in self._attributes)
-        row = np.asarray(latest, dtype=self._dtype)
+            record.asctime = self._format_time(record.created)
+        # a tuple is assigned directly to a row of the structured array, creating a
+        # temporary ndarray for every record is slower
+        row = tuple(record.__dict__[a] for a in self._attributes)
         if self._auto_resize:
             if self._index >= self._data.size:
                 self._resize()
             self._data[self._index] = row
             self._index += 1
         else:
-            self._data = np.append(self._data, row)
-
-    def _resize(self, new_allocated=None):
-        # Over-allocates proportional to the size of the ndarray, making room
-        # for additional growth. This follows the over-allocating procedure that
-        # Python uses when appending to a list object, see `list_resize` in
-        # https://github.com/python/cpython/blob/master/Objects/listobject.c
-        if new_allocated is None:
-            new_size = self._data.size + 1
-            new_allocated = new_size + (new_size >> 3) + (3 if new_size < 9 else 6)
-
+            # append to an over-allocated buffer and view the rows that are filled so that
+            # the size of the Dataset equals the number of records. If the data was replaced
+            # since the last record, e.g., remove_empty_rows() was called, or the buffer is
+            # full then copy the data to a new buffer
+            size = self._data.size
+            if self._data is not self._view or size >= self._buffer.size:
+                self._buffer = self._allocate(_over_allocate(size))
+            self._buffer[size] = row
+            self._view = self._data = self._buffer[:size + 1]
+
+    def _format_time(self, created):
+        t = datetime.fromtimestamp(created)
+        if self._date_fmt_parts is None:
+            return t.strftime(self._date_fmt)
+
+        second = t.replace(microsecond=0)
+        if second != self._asctime_second:
+            self._asctime_second = second
+            self._asctime_parts = [second.strftime(part) for part in self._date_fmt_parts]
+        return ('%06d' % t.microsecond).join(self._asctime_parts)
+
+    def _allocate(self, new_allocated):
         # don't use self._data.resize() because that fills the newly-created rows
         # with 0 and want to fill the new rows with None to be explicit that the
         # new rows are not associated with logging records
         array = np.empty((new_allocated,), dtype=self._dtype)
         array[:self._data.size] = self._data
-        self._data = array
+        return array
+
+    def _resize(self, new_allocated=None):
+        if new_allocated is None:
+            new_allocated = _over_allocate(self._data.size)
+        self._data = self._allocate(new_allocated)
+
+
+def _over_allocate(size):
+    # Over-allocates proportional to the size of the ndarray, making room
+    # for additional growth. This follows the over-allocating procedure that
+    # Python uses when appending to a list object, see `list_resize` in
+    # https://github.com/python/cpython/blob/master/Objects/listobject.c
+    new_size = size + 1
+    return new_size + (new_size >> 3) + (3 if new_size < 9 else 6)
@@ -25,7 +25,12 @@ class ExcelReader(Spreadsheet):
         **kwargs
             All keyword arguments are passed to :func:`~xlrd.open_workbook`. Can use
             an `encoding` keyword argument as an alias for `encoding_override`. The
-            default `on_demand` value is :data:`True`.
+            default `on_demand` and `ragged_rows` values are :data:`True`. Since
+            `ragged_rows` is :data:`True`, the rows of a sheet in the :attr:`.workbook`
+            are not padded with empty cells (for example, :meth:`~xlrd.sheet.Sheet.row_len`
+            may be less than :attr:`~xlrd.sheet.Sheet.ncols`). Specify ``ragged_rows=False``
+            if you use the :attr:`.workbook` directly and expect padded rows. The values
+            returned by :meth:`.read` are the same for either value.
 
         Examples
         --------
@@ -38,6 +43,11 @@ class ExcelReader(Spreadsheet):
         if 'on_demand' not in kwargs:
             kwargs['on_demand'] = True
 
+        # change the default ragged_rows value so that a sheet with a cell that is far
+        # from A1 does not get padded with an empty cell in every row and column before it
+        if 'ragged_rows' not in kwargs:
+            kwargs['ragged_rows'] = True
+
         # 'encoding' is an alias for 'encoding_override'
         encoding = kwargs.pop('encoding', None)
         if encoding is not None:
@@ -53,7 +63,11 @@ class ExcelReader(Spreadsheet):
 
     @property
     def workbook(self):
-        """:class:`~xlrd.book.Book`: The workbook instance."""
+        """:class:`~xlrd.book.Book`: The workbook instance.
+
+        The rows of a sheet are ragged (not padded with empty cells), unless
+        ``ragged_rows=False`` was specified when the reader was created.
+        """
         return self._workbook
 
     def close(self):
@@ -121,28 +135,28 @@ class ExcelReader(Spreadsheet):
             raise ValueError('There is no sheet named {!r} in {!r}'.format(sheet_name, self._file))
 
         if not cell:
-            return [tuple(self._value(sheet, r, c, as_datetime) for c in range(sheet.ncols))
-                    for r in range(sheet.nrows)]
+            return [self._row(sheet, r, 0, sheet.ncols, as_datetime) for r in range(sheet.nrows)]
 
         split = cell.split(':')
         r1, c1 = self.to_indices(split[0])
         if r1 is None:
             r1 = 0
 
+        # a cell that is outside the used range of the sheet is empty
+        outside = r1 >= sheet.nrows or c1 >= sheet.ncols
+
         if len(split) == 1:
-            try:
-                return self._value(sheet, r1, c1, as_datetime)
-            except IndexError:
+            if outside:
                 return
+            return self._value(sheet, r1, c1, as_datetime)
 
-        if r1 >= sheet.nrows or c1 >= sheet.ncols:
+        if outside:
             return []
 
         r2, c2 = self.to_indices(split[1])
         r2 = sheet.nrows if r2 is None else min(r2+1, sheet.nrows)
         c2 = min(c2+1, sheet.ncols)
-        return [tuple(self._value(sheet, r, c, as_datetime) for c in range(c1, c2))
-                for r in range(r1, r2)]
+        return [self._row(sheet, r, c1, c2, as_datetime) for r in range(r1, r2)]
 
     def sheet_names(self):
         """Get the names of all sheets in the Excel spreadsheet.
@@ -154,26 +168,45 @@ class ExcelReader(Spreadsheet):
         """
         return tuple(self._workbook.sheet_names())
 
+    def _row(self, sheet, row, start, stop, as_datetime):
+        """Get the values of the cells in a row from column `start` to `stop`."""
+        # slicing the types and values of a row avoids creating a Cell for every cell
+        types = sheet.row_types(row, start, stop)
+        values = sheet.row_values(row, start, stop)
+        converted = tuple(self._convert(t, v, as_datetime) for t, v in zip(types, values))
+        missing = stop - start - len(converted)
+        if missing > 0:
+            # a ragged row only contains the cells up to its last non-empty cell
+            return converted + (None,) * missing
+        return converted
+
     def _value(self, sheet, row, col, as_datetime):
         """Get the value of a cell."""
-        cell = sheet.cell(row, col)
-        t = cell.ctype
+        try:
+            cell = sheet.cell(row, col)
+        except IndexError:
+            # a ragged row only contains the cells up to its last non-empty cell
+            return None
+        return self._convert(cell.ctype, cell.value, as_datetime)
+
+    def _convert(self, t, value, as_datetime):
+        """Convert the value of a cell based on the type of the cell."""
         if t == _xlrd.XL_CELL_NUMBER:
-            if cell.value.is_integer():
-                return int(cell.value)
-            return cell.value
+            if value.is_integer():
+                return int(value)
+            return value
         elif t == _xlrd.XL_CELL_DATE:
-            dt = datetime(*_xlrd.xldate_as_tuple(cell.value, self._workbook.datemode))
+            dt = datetime(*_xlrd.xldate_as_tuple(value, self._workbook.datemode))
             if dt.hour + dt.minute + dt.second + dt.microsecond == 0:
                 dt = dt.date()
             if as_datetime:
                 return dt
             return str(dt)
         elif t == _xlrd.XL_CELL_BOOLEAN:
-            return bool(cell.value)
+            return bool(value)
         elif t == _xlrd.XL_CELL_EMPTY:
             return None
         elif t == _xlrd.XL_CELL_ERROR:
-            return _xlrd.error_text_from_code[cell.value]
+            return _xlrd.error_text_from_code[value]
         else:
-            return cell.value.strip()
+            return value.strip()
@@ -3,10 +3,20 @@ Generic class for spreadsheets.
 """
 import re
 import string
+from functools import lru_cache
 
 _cell_regex = re.compile(r'^([A-Z]+)(\d*)$')
 
 
+@lru_cache(maxsize=1024)
+def _column_index(letters):
+    # the same column letters are converted many times when reading a spreadsheet
+    index = 0
+    for c in letters:
+        index = index * 26 + ord(c) - 64
+    return index - 1
+
+
 class Spreadsheet(object):
 
     def __init__(self, file):
@@ -140,12 +150,7 @@ class Spreadsheet(object):
 
         letters, numbers = match.groups()
         row = max(0, int(numbers) - 1) if numbers else None
-        uppercase = string.ascii_uppercase
-        col = sum(
-            (26**i) * (1+uppercase.index(c))
-            for i, c in enumerate(letters[::-1])
-        )
-        return row, col-1
+        return row, _column_index(letters)
 
     @staticmethod
     def to_slices(cells, row_step=None, column_step=None):
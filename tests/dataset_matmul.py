@@ -13,17 +13,17 @@ def run():
     for rhs in ([[5, 6], [7, 8]], d2):
         result = np.matmul(d1, rhs)
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([[19, 22], [43, 50]]))
+        np.testing.assert_array_equal(result, np.array([[19, 22], [43, 50]]))
 
         result = d1 @ rhs
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([[19, 22], [43, 50]]))
+        np.testing.assert_array_equal(result, np.array([[19, 22], [43, 50]]))
 
     for lhs in ([[5, 6], [7, 8]], d2):
         result = np.matmul(lhs, d1)
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([[23, 34], [31, 46]]))
+        np.testing.assert_array_equal(result, np.array([[23, 34], [31, 46]]))
 
         result = lhs @ d1
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([[23, 34], [31, 46]]))
+        np.testing.assert_array_equal(result, np.array([[23, 34], [31, 46]]))
@@ -1,52 +1,133 @@
-import sys
+import operator
 
 import numpy as np
 import pytest
 
+from msl.io.base import Root
 from msl.io.dataset import Dataset
 
-
-def test_instantiate():
-    dset = Dataset(name='/data', parent=None, read_only=True, shape=(10, 10))
-    assert dset.name == '/data'
-    assert len(dset) == 10
+# input and expected-result arrays that are shared by the tests, a Dataset
+# does not copy its data, so a Dataset is created from a copy of an array
+_A0_9 = np.arange(9)
+_A10_19 = np.arange(10, 19)
+_A1_6 = np.arange(1, 6)
+_A0_5 = np.arange(5)
+_A100_200 = np.arange(100, 200)
+_A101_201 = np.arange(101, 201)
+_AND_RESULT = np.array([0, 1, 0, 1, 4, 5, 0, 1, 0])
+_XOR_RESULT = np.array([10, 10, 14, 14, 10, 10, 22, 22, 26])
+_OR_RESULT = np.array([10, 11, 14, 15, 14, 15, 22, 23, 26])
+
+# a Dataset that is created from a list uses dtype=float by default
+_D123 = np.array([1., 2., 3.])
+_D456 = np.array([4., 5., 6.])
+_DATA_2X2 = np.array([[1., 2.], [3., 4.]])
+
+# the right-hand operands of the arithmetic tests
+_RHS_TRUEDIV = np.array([4., 4., 10.])
+_RHS_FLOORDIV = np.array([1e2, 1e3, 1e4])
+_RHS_MOD = np.array([2., 3.])
+_RHS_LSHIFT = np.array([3, 7, 11, 15, 19])
+_RHS_RSHIFT = np.array([3, 7, 12, 52, 62])
+
+# the expected results that are checked more than once
+_EXP_POW = np.array([1., 8., 27.])
+_EXP_RPOW = np.array([3., 9., 27.])
+_ZEROS_5 = np.zeros(5, dtype=int)
+
+# ('z', str) would be a zero-length 'U0' field, use a fixed width
+_MIXED_DTYPE = np.dtype([('x', float), ('y', int), ('z', 'U8')])
+
+
+@pytest.fixture(scope='module')
+def mixed():
+    # a read-only Dataset with named fields that is shared by the tests in this module,
+    # use np.zeros so that the string field has a known initial value
+    data = np.zeros((100,), dtype=_MIXED_DTYPE)
+    return Dataset(name='mixed', parent=None, read_only=True, data=data)
+
+
+@pytest.fixture(scope='module')
+def d1():
+    # the read-only Datasets that are shared by the arithmetic tests
+    return Dataset(name='/d1', parent=None, read_only=True, data=_D123.copy())
+
+
+@pytest.fixture(scope='module')
+def d2():
+    return Dataset(name='/d2', parent=None, read_only=True, data=_D456.copy())
+
+
+@pytest.fixture(scope='module')
+def bitwise():
+    # a read-only integer Dataset that is shared by the bit-shift tests
+    return Dataset(name='/bitwise', parent=None, read_only=True, data=_A1_6.copy())
+
+
+@pytest.fixture
+def mixed_writeable(mixed):
+    # a writeable copy of the shared Dataset for a test that modifies the data
+    return mixed.copy(read_only=False)
+
+
+@pytest.mark.parametrize(
+    ('name', 'shape', 'dtype', 'names'),
+    [('/data', (10, 10), float, None),
+     ('dataset 1', (100,), int, None),
+     ('mixed', (100,), _MIXED_DTYPE, ('x', 'y', 'z'))]
+)
+def test_instantiate(name, shape, dtype, names):
+    dset = Dataset(name=name, parent=None, read_only=True, shape=shape, dtype=dtype)
+    assert dset.name == name
+    assert len(dset) == shape[0]
     assert dset.size == 100
-    assert dset.dtype == float
-    assert dset.dtype.names is None
+    dt = dset.dtype
+    assert dt == dtype
+    assert dt.names == names
 
-    dset = Dataset(name='dataset 1', parent=None, read_only=True, shape=(100,), dtype=int)
-    assert dset.name == 'dataset 1'
-    assert len(dset) == 100
-    assert dset.size == 100
-    assert dset.dtype == int
-    assert dset.dtype.names is None
 
-    dset = Dataset(name='mixed', parent=None, read_only=True, shape=(100,), dtype=[('x', float), ('y', int), ('z', str)])
+def test_instantiate_named_fields(mixed):
+    dset = mixed
     assert dset.name == 'mixed'
-    assert len(dset) == 100
+    # every field of a 1-D structured array has the shape of the array
+    assert dset.shape == (100,)
     assert dset.size == 100
-    assert len(dset['x']) == 100
-    assert dset.dtype[0] == float
-    assert len(dset['y']) == 100
-    assert dset.dtype[1] == int
-    assert len(dset['z']) == 100
-    assert dset.dtype[2] == str
-    assert dset.dtype.names == ('x', 'y', 'z')
+    dt = dset.dtype
+    assert dt[0] == float
+    assert dt[1] == int
+    assert dt[2] == 'U8'
+    assert dt.names == ('x', 'y', 'z')
+
 
+def test_instantiate_from_data():
     dset = Dataset(name='xxx', parent=None, read_only=True, data=[1, 2, 3])
     assert len(dset) == 3
-    assert dset[0] == 1
-    assert dset[1] == 2
-    assert dset[2] == 3
+    np.testing.assert_array_equal(np.asarray(dset), [1, 2, 3])
     d = dset[:]
     assert len(d) == 3
-    assert d[0] == 1
-    assert d[1] == 2
-    assert d[2] == 3
+    np.testing.assert_array_equal(d, [1, 2, 3])
     d = dset[::2]
     assert len(d) == 2
-    assert d[0] == 1
-    assert d[1] == 3
+    np.testing.assert_array_equal(d, [1, 3])
+
+
+def test_invalid_name():
+    # the name must be a non-empty string
+    for n in [None, '']:
+        with pytest.raises(ValueError, match=r'non-empty string'):
+            Dataset(name=n, parent=None, read_only=True)
+
+    # the ValueError is raised before the Dataset is added to
+    # the parent, so the same Root can be used for every name
+    root = Root('')
+    for n in ['/', '/a', 'a/b', 'ab/']:
+        with pytest.raises(ValueError, match=r'cannot contain the "/" character'):
+            Dataset(name=n, parent=root, read_only=True)
+    assert len(root) == 0
+
+    root.create_group('msl')
+    with pytest.raises(ValueError, match=r'is not unique'):
+        Dataset(name='msl', parent=root, read_only=True)
 
 
 def test_metadata():
@@ -56,92 +137,104 @@ def test_metadata():
     # 'name' is absorbed by Vertex
     # 'shape', 'dtype' and 'order' are kwargs that are absorbed by numpy
 
-    assert len(dset.metadata) == 3
-    assert dset.metadata['temperature'] == 21.3
-    assert dset.metadata['lab'] == 'msl'
-    assert dset.metadata['x'] == -1
+    md = dset.metadata
+    assert md == {'temperature': 21.3, 'lab': 'msl', 'x': -1}
 
-    assert not dset.metadata.read_only
+    assert not md.read_only
 
     dset.add_metadata(one=1, two=2, three=3)
-    assert len(dset.metadata) == 6
-    assert dset.metadata['one'] == 1
-    assert dset.metadata['two'] == 2
-    assert dset.metadata['three'] == 3
+    assert md == {'temperature': 21.3, 'lab': 'msl', 'x': -1, 'one': 1, 'two': 2, 'three': 3}
 
 
-def test_field_access_as_attribute():
+def test_field_access_as_attribute(mixed_writeable):
     # no names defined in the dtype
     dset = Dataset(name='data', parent=None, read_only=False, shape=(3, 3))
     assert len(dset) == 3
     assert dset.shape == (3, 3)
-    assert dset.dtype == float
-    assert dset.dtype.names is None
+    dt = dset.dtype
+    assert dt == float
+    assert dt.names is None
 
     with pytest.raises(AttributeError):
         _ = dset.there_are_no_field_names
 
     # names are defined in the dtype
-    dset = Dataset(name='data', parent=None, read_only=False, shape=(100,),
-                   dtype=[('x', float), ('y', int), ('z', str)])
-    assert len(dset['x']) == 100
-    assert len(dset.x) == 100
-    assert len(dset['y']) == 100
-    assert len(dset.y) == 100
-    dset.y[:] = 1
-    for val in dset.y:
-        assert val == 1
-    dset.x = np.arange(100, 200)
-    assert np.array_equal(dset.x + dset.y, np.arange(101, 201))
-    assert len(dset['z']) == 100
-    assert len(dset.z) == 100
-    assert dset['z'][0] == ''
-    assert dset.z[0] == ''
+    dset = mixed_writeable
     assert dset.dtype.names == ('x', 'y', 'z')
+    assert dset.shape == (100,)
+    y = dset.y
+    assert y.shape == (100,)
+    y[:] = 1
+    # y is a strided view into the structured array, the comparison is still a single vectorized call
+    np.testing.assert_array_equal(y, 1)
+    np.testing.assert_array_equal(dset['y'], y)
+    dset.x = _A100_200
+    np.testing.assert_array_equal(dset.x + dset.y, _A101_201)
+    np.testing.assert_array_equal(dset['z'], '')
+    np.testing.assert_array_equal(dset.z, '')
+
+    # an ndarray attribute takes precedence over a field with the same name
+    dset = Dataset(name='data', parent=None, read_only=True, shape=(3,), dtype=[('size', int), ('max', float)])
+    assert dset.size == 3
+    assert dset['size'].shape == (3,)
+    assert callable(dset.max)
+
+
+def test_item_access_returns_base_ndarray(mixed):
+    # Dataset is not an ndarray subclass, indexing and field access must return a base
+    # ndarray (not a view cast to a subclass, e.g., numpy.recarray) or a numpy scalar
+    assert type(mixed['x']) is np.ndarray
+    assert type(mixed.x) is np.ndarray
+    assert type(mixed[::2]) is np.ndarray
+    assert type(mixed['x'][10]) is np.float64
+    assert mixed['x'].base is mixed.data
+
+    dset = Dataset(name='d', parent=None, read_only=True, data=_DATA_2X2.copy())
+    assert type(dset[:, 0]) is np.ndarray
+    assert type(dset[0, 0]) is np.float64
 
 
 def test_read_only():
     dset = Dataset(name='my data', parent=None, read_only=True, shape=(100,), dtype=int)
     assert dset.name == 'my data'
     assert len(dset) == 100
+    md = dset.metadata
     assert dset.read_only
-    assert dset.metadata.read_only
+    assert md.read_only
 
     # cannot modify data
-    with pytest.raises(ValueError):
-        dset[:] = 1
-
-    # cannot modify data
-    with pytest.raises(ValueError):
-        dset[0] = 1
+    for index in (slice(None), 0):
+        with pytest.raises(ValueError, match=r'read-only'):
+            dset[index] = 1
 
     # make writable
     dset.read_only = False
     assert not dset.read_only
-    assert not dset.metadata.read_only
+    assert not md.read_only
 
     # can modify data
     dset[:] = 1
-    assert dset[0] == 1
+    np.testing.assert_array_equal(dset.data, 1)
 
     # make read only again
     dset.read_only = True
     assert dset.read_only
-    assert dset.metadata.read_only
+    assert md.read_only
 
     # cannot modify data
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=r'read-only'):
         dset[:] = 1
 
     # can make a dataset writeable but the metadata read-only
     dset.read_only = False
     assert not dset.read_only
-    assert not dset.metadata.read_only
-    dset.metadata.read_only = True
+    assert not md.read_only
+    md.read_only = True
     assert not dset.read_only
-    assert dset.metadata.read_only
+    assert md.read_only
+    assert dset.metadata is md
     dset[:] = 1
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=r'read-only mode'):
         dset.add_metadata(some_more_info=1)
 
 
@@ -156,8 +249,8 @@ def test_copy():
     assert copy.read_only
     assert copy.metadata.read_only
     assert copy.name == 'abcdefg'
-    for i in range(10):
-        assert orig[i] == copy[i]
+    np.testing.assert_array_equal(orig.data, copy.data)
+    assert not np.shares_memory(orig.data, copy.data)
     assert orig.metadata['voltage'] == copy.metadata['voltage']
     assert orig.metadata['current'] == copy.metadata['current']
 
@@ -174,11 +267,25 @@ def test_copy():
     assert orig[1] != copy[1]
 
 
+def test_copy_does_not_deepcopy():
+    # the ndarray is copied by ndarray.copy(), so the elements of an object array
+    # are the same objects in the copy, copy.deepcopy() would create new objects
+    item = [1, 2, 3]
+    data = np.empty((2,), dtype=object)
+    data[0] = item
+    data[1] = {'a': 1}
+    orig = Dataset(name='d', parent=None, read_only=True, data=data, voltage=1.2)
+    cp = orig.copy()
+    assert cp.data is not orig.data
+    assert cp.data[0] is item
+    assert cp.data[1] is orig.data[1]
+    assert cp.metadata == orig.metadata
+
+
 def test_string_representation():
-    dset = Dataset(name='abcd', parent=None, data=[[1, 2], [3, 4]], read_only=True, foo='bar')
+    dset = Dataset(name='abcd', parent=None, data=_DATA_2X2.copy(), read_only=True, foo='bar')
 
-    assert repr(dset) in ["<Dataset 'abcd' shape=(2, 2) dtype='<f8' (1 metadata)>",
-                          "<Dataset 'abcd' shape=(2L, 2L) dtype='<f8' (1 metadata)>"]
+    assert repr(dset) == "<Dataset 'abcd' shape=(2, 2) dtype='<f8' (1 metadata)>"
 
     assert str(dset) == ('array([[1., 2.],\n'
                          '       [3., 4.]])')
@@ -187,22 +294,24 @@ def test_string_representation():
 
     # just for fun, test more index access
     assert dset[0, 0] + dset[0, 1] == 3
-    assert all(dset[:, 0] + dset[:, 1] == [3, 7])
-    assert all(dset[0, :] + dset[1, :] == [4, 6])
+    np.testing.assert_array_equal(dset[:, 0] + dset[:, 1], [3, 7])
+    np.testing.assert_array_equal(dset[0, :] + dset[1, :], [4, 6])
 
 
 def test_ndarray_attribute():
-    dset = Dataset(name='abcd', parent=None, data=[[1, 2], [3, 4]], read_only=True)
+    dset = Dataset(name='abcd', parent=None, data=_DATA_2X2.copy(), read_only=True)
 
     as_list = dset.tolist()
     assert isinstance(as_list, list)
-    assert dset.tolist() == [[1, 2], [3, 4]]
+    assert as_list == [[1, 2], [3, 4]]
     assert dset.flatten().tolist() == [1, 2, 3, 4]
 
     assert dset.max() == 4
     assert dset.min() == 1
-    assert all(dset.max(axis=1) == [2, 4])
-    assert all(dset.max(axis=0) == [3, 4])
+    max_axis1 = dset.max(axis=1)
+    max_axis0 = dset.max(axis=0)
+    np.testing.assert_array_equal(max_axis1, [2, 4])
+    np.testing.assert_array_equal(max_axis0, [3, 4])
 
 
 def test_scalar():
@@ -213,286 +322,129 @@ def test_scalar():
     assert dset.data == 5.0
 
 
-def test_add():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 5, 6])
-
-    for rhs in ([4, 5, 6], d2):
-        result = d1 + rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([5., 7., 9.]))
-
-    for lhs in ([4, 5, 6], d2):
-        result = lhs + d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([5., 7., 9.]))
-
-
-def test_sub():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 5, 6])
-
-    for rhs in ([4, 5, 6], d2):
-        result = d1 - rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([-3., -3., -3.]))
-
-    for lhs in ([4, 5, 6], d2):
-        result = lhs - d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([3., 3., 3.]))
-
-
-def test_mul():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 5, 6])
-
-    for rhs in ([4, 5, 6], d2):
-        result = d1 * rhs
+@pytest.mark.parametrize(
+    ('op', 'lhs', 'rhs', 'expected', 'reflected'),
+    [(operator.add, _D123, _D456, [5., 7., 9.], [5., 7., 9.]),
+     (operator.sub, _D123, _D456, [-3., -3., -3.], [3., 3., 3.]),
+     (operator.mul, _D123, _D456, [4., 10., 18.], [4., 10., 18.]),
+     (operator.truediv, np.array([1., 2., 1.]), _RHS_TRUEDIV, [0.25, 0.5, 0.1], [4., 2., 10.]),
+     (operator.floordiv, np.array([1e3, 1e4, 1e5]), _RHS_FLOORDIV, [10., 10., 10.], [0., 0., 0.]),
+     (operator.mod, np.array([4., 7.]), _RHS_MOD, [0, 1], [2, 3]),
+     (operator.pow, _D123, _D456, [1., 32., 729.], [4., 25., 216.]),
+     (pow, _D123, _D456, [1., 32., 729.], [4., 25., 216.]),
+     (operator.lshift, _A1_6, _RHS_LSHIFT, [8, 256, 6144, 131072, 2621440], [6, 28, 88, 240, 608]),
+     (operator.rshift, _A1_6, _RHS_RSHIFT, _ZEROS_5, [1, 1, 1, 3, 1]),
+     (operator.and_, _A0_9, _A10_19, _AND_RESULT, _AND_RESULT),
+     (operator.xor, _A0_9, _A10_19, _XOR_RESULT, _XOR_RESULT),
+     (operator.or_, _A0_9, _A10_19, _OR_RESULT, _OR_RESULT)]
+)
+def test_binary_operator(op, lhs, rhs, expected, reflected):
+    d1 = Dataset(name='/d1', parent=None, read_only=True, data=lhs.copy())
+    d2 = Dataset(name='/d2', parent=None, read_only=True, data=rhs.copy())
+
+    for other in (rhs, d2):
+        result = op(d1, other)
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([4., 10., 18.]))
+        np.testing.assert_array_equal(result, expected)
 
-    for lhs in ([4, 5, 6], d2):
-        result = lhs * d1
+    # a list, rather than an ndarray, is the left operand so that the reflected method of Dataset is called
+    for other in (rhs.tolist(), d2):
+        result = op(other, d1)
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([4., 10., 18.]))
+        np.testing.assert_array_equal(result, reflected)
 
 
-def test_truediv():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 1])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 4, 10])
-
-    for rhs in ([4., 4., 10.], d2):
-        result = d1 / rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([0.25, 0.5, 0.1]))
-
-    for lhs in ([4., 4., 10.], d2):
-        result = lhs / d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([4., 2., 10.]))
-
-
-def test_floordiv():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1e3, 1e4, 1e5])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[1e2, 1e3, 1e4])
-
-    for rhs in ([1e2, 1e3, 1e4], d2):
-        result = d1 // rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([10., 10., 10.]))
-
-    for lhs in ([1e2, 1e3, 1e4], d2):
-        result = lhs // d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([0., 0., 0.]))
-
-
-def test_pow():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 5, 6])
-
+def test_pow(d1):
     result = d1 ** 3
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([1., 8., 27.]))
+    np.testing.assert_array_equal(result, _EXP_POW)
 
     result = pow(d1, 3)
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([1., 8., 27.]))
+    np.testing.assert_array_equal(result, _EXP_POW)
 
     result = 3 ** d1
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([3., 9., 27.]))
+    np.testing.assert_array_equal(result, _EXP_RPOW)
 
     result = pow(3, d1)
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([3., 9., 27.]))
-
-    for rhs in ([4., 5., 6.], d2):
-        result = d1 ** rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([1., 32., 729.]))
-
-        result = pow(d1, rhs)
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([1., 32., 729.]))
-
-    for lhs in ([4., 5., 6.], d2):
-        result = lhs ** d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([4., 25., 216.]))
-
-        result = pow(lhs, d1)
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([4., 25., 216.]))
+    np.testing.assert_array_equal(result, _EXP_RPOW)
 
 
-@pytest.mark.skipif(sys.version_info[:2] < (3, 5), reason='the @ operator requires Python 3.5+')
 def test_matmul():
     import dataset_matmul
     dataset_matmul.run()
 
 
 def test_mod():
-    d = Dataset(name='/d', parent=None, read_only=True, data=list(range(7)))
+    d = Dataset(name='/d', parent=None, read_only=True, data=np.arange(7))
 
     result = d % 5
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([0, 1, 2, 3, 4, 0, 1]))
-
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[4, 7])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[2, 3])
-
-    for rhs in ([2, 3], d2):
-        result = d1 % rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([0, 1]))
-
-    for lhs in ([2, 3], d2):
-        result = lhs % d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([2, 3]))
+    np.testing.assert_array_equal(result, np.array([0, 1, 2, 3, 4, 0, 1]))
 
 
 def test_divmod():
     d1 = Dataset(name='/d1', parent=None, read_only=True, data=[3, 7, 12, 52, 62])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=np.arange(1, 6))
+    d2 = Dataset(name='/d2', parent=None, read_only=True, data=_A1_6.copy())
 
-    for rhs in ([1, 2, 3, 4, 5], d2):
+    for rhs in (_A1_6, d2):
         div, mod = divmod(d1, rhs)
         assert isinstance(div, np.ndarray)
-        assert np.array_equal(div, np.array([3,  3,  4, 13, 12]))
+        np.testing.assert_array_equal(div, np.array([3,  3,  4, 13, 12]))
         assert isinstance(mod, np.ndarray)
-        assert np.array_equal(mod, np.array([0, 1, 0, 0, 2]))
+        np.testing.assert_array_equal(mod, np.array([0, 1, 0, 0, 2]))
 
-    for lhs in ([1, 2, 3, 4, 5], d2):
+    for lhs in (_A1_6.tolist(), d2):
         div, mod = divmod(lhs, d1)
         assert isinstance(div, np.ndarray)
-        assert np.array_equal(div, np.array([0, 0, 0, 0, 0]))
+        np.testing.assert_array_equal(div, _ZEROS_5)
         assert isinstance(mod, np.ndarray)
-        assert np.array_equal(mod, np.array([1, 2, 3, 4, 5]))
+        np.testing.assert_array_equal(mod, _A1_6)
 
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.arange(5))
+    d = Dataset(name='/d', parent=None, read_only=True, data=_A0_5.copy())
     div, mod = divmod(d, 3)
     assert isinstance(div, np.ndarray)
-    assert np.array_equal(div, np.array([0, 0, 0, 1, 1]))
+    np.testing.assert_array_equal(div, np.array([0, 0, 0, 1, 1]))
     assert isinstance(mod, np.ndarray)
-    assert np.array_equal(mod, np.array([0, 1, 2, 0, 1]))
-
+    np.testing.assert_array_equal(mod, np.array([0, 1, 2, 0, 1]))
 
-def test_lshift():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=np.array([1, 2, 3, 4, 5]))
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=np.array([3, 7, 11, 15, 19]))
 
-    result = d1 << 1
+def test_lshift(bitwise):
+    result = bitwise << 1
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([2, 4, 6, 8, 10]))
+    np.testing.assert_array_equal(result, np.array([2, 4, 6, 8, 10]))
 
-    result = 1 << d1
+    result = 1 << bitwise
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([2, 4, 8, 16, 32]))
+    np.testing.assert_array_equal(result, np.array([2, 4, 8, 16, 32]))
 
-    for rhs in ([3, 7, 11, 15, 19], d2):
-        result = d1 << rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([8, 256, 6144, 131072, 2621440]))
 
-    for lhs in ([3, 7, 11, 15, 19], d2):
-        result = lhs << d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([6, 28, 88, 240, 608]))
-
-
-def test_rshift():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=np.array([1, 2, 3, 4, 5]))
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=np.array([3, 7, 12, 52, 62]))
-
-    result = d1 >> 10
+def test_rshift(bitwise):
+    result = bitwise >> 10
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([0, 0, 0, 0, 0]))
+    np.testing.assert_array_equal(result, _ZEROS_5)
 
-    result = 10 >> d1
+    result = 10 >> bitwise
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([5, 2, 1, 0, 0]))
-
-    for rhs in ([3, 7, 12, 52, 62], d2):
-        result = d1 >> rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([0, 0, 0, 0, 0]))
-
-    for lhs in ([3, 7, 12, 52, 62], d2):
-        result = lhs >> d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([1, 1, 1, 3, 1]))
-
-
-def test_and():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=np.arange(9))
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=np.arange(10, 19))
-
-    for rhs in ([10, 11, 12, 13, 14, 15, 16, 17, 18], d2):
-        result = d1 & rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([0, 1, 0, 1, 4, 5, 0, 1, 0]))
-
-    for lhs in ([10, 11, 12, 13, 14, 15, 16, 17, 18], d2):
-        result = lhs & d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([0, 1, 0, 1, 4, 5, 0, 1, 0]))
+    np.testing.assert_array_equal(result, np.array([5, 2, 1, 0, 0]))
 
 
-def test_xor():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=np.arange(9))
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=np.arange(10, 19))
-
-    for rhs in ([10, 11, 12, 13, 14, 15, 16, 17, 18], d2):
-        result = d1 ^ rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([10, 10, 14, 14, 10, 10, 22, 22, 26]))
-
-    for lhs in ([10, 11, 12, 13, 14, 15, 16, 17, 18], d2):
-        result = lhs ^ d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([10, 10, 14, 14, 10, 10, 22, 22, 26]))
-
-
-def test_or():
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=np.arange(9))
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=np.arange(10, 19))
-
-    for rhs in ([10, 11, 12, 13, 14, 15, 16, 17, 18], d2):
-        result = d1 | rhs
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([10, 11, 14, 15, 14, 15, 22, 23, 26]))
-
-    for lhs in ([10, 11, 12, 13, 14, 15, 16, 17, 18], d2):
-        result = lhs | d1
-        assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([10, 11, 14, 15, 14, 15, 22, 23, 26]))
-
-
-def test_neg():
+def test_neg(d1, d2):
     # unary "-"
-
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 5, 6])
-
-    for rhs in [[4, 5, 6], d2]:
+    for rhs in [_D456, d2]:
         result = -d1 + rhs
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([3, 3, 3]))
+        np.testing.assert_array_equal(result, np.array([3, 3, 3]))
 
 
-def test_pos():
+def test_pos(d1, d2):
     # unary "+"
-
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
-    d2 = Dataset(name='/d2', parent=None, read_only=True, data=[4, 5, 6])
-
-    for rhs in [[4, 5, 6], d2]:
+    for rhs in [_D456, d2]:
         result = +d1 - rhs
         assert isinstance(result, np.ndarray)
-        assert np.array_equal(result, np.array([-3, -3, -3]))
+        np.testing.assert_array_equal(result, np.array([-3, -3, -3]))
 
 
 def test_abs():
@@ -502,7 +454,7 @@ def test_abs():
 
     result = abs(d)
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([1, 2, 3, 4]))
+    np.testing.assert_array_equal(result, np.array([1, 2, 3, 4]))
 
 
 def test_invert():
@@ -512,89 +464,49 @@ def test_invert():
 
     result = ~d
     assert isinstance(result, np.ndarray)
-    assert np.array_equal(result, np.array([-2, 1, -4, 3]))
-
-
-def test_assignments():
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d += 1
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([2, 3, 4]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d -= 1
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([0, 1, 2]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d *= 10
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([10, 20, 30]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([10, 20, 30]))
-    d /= 10
+    np.testing.assert_array_equal(result, np.array([-2, 1, -4, 3]))
+
+
+@pytest.mark.parametrize(
+    ('data', 'op', 'value', 'expected'),
+    [([1, 2, 3], operator.iadd, 1, [2, 3, 4]),
+     ([1, 2, 3], operator.isub, 1, [0, 1, 2]),
+     ([1, 2, 3], operator.imul, 10, [10, 20, 30]),
+     ([10, 20, 30], operator.itruediv, 10, [1, 2, 3]),
+     ([10, 20, 30], operator.ifloordiv, 5, [2, 4, 6]),
+     ([10, 20, 30], operator.imod, 15, [10, 5, 0]),
+     ([1, 2, 3], operator.ipow, 3, [1, 8, 27]),
+     ([1, 2, 3], operator.ilshift, 3, [8, 16, 24]),
+     ([10, 20, 30], operator.irshift, 2, [2, 5, 7]),
+     ([1, 2, 3], operator.iand, 2, [0, 2, 2]),
+     ([1, 2, 3], operator.ixor, 2, [3, 0, 1]),
+     ([1, 2, 3], operator.ior, 2, [3, 2, 3])]
+)
+def test_assignments(data, op, value, expected):
+    d = Dataset(name='/d', parent=None, read_only=True, data=np.array(data))
+    d = op(d, value)
     assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([1, 2, 3]))
+    np.testing.assert_array_equal(d, expected)
 
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([10, 20, 30]))
-    d //= 5
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([2, 4, 6]))
 
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([10, 20, 30]))
-    d %= 15
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([10, 5, 0]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d **= 3
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([1, 8, 27]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d <<= 3
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([8, 16, 24]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([10, 20, 30]))
-    d >>= 2
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([2, 5, 7]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d &= 2
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([0, 2, 2]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d ^= 2
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([3, 0, 1]))
-
-    d = Dataset(name='/d', parent=None, read_only=True, data=np.array([1, 2, 3]))
-    d |= 2
-    assert isinstance(d, np.ndarray)
-    assert np.array_equal(d, np.array([3, 2, 3]))
-
-
-def test_numpy_function():
+def test_numpy_function(d1):
     # np.xxx() is also valid syntax with a Dataset
 
     array = np.array([1, 2, 3])
-    d1 = Dataset(name='/d1', parent=None, read_only=True, data=[1, 2, 3])
 
     cos = np.cos(d1)
     assert isinstance(cos, np.ndarray)
-    assert np.array_equal(cos, np.cos(array))
+    np.testing.assert_array_equal(cos, np.cos(array))
 
     sqrt = np.sqrt(d1)
     assert isinstance(sqrt, np.ndarray)
-    assert np.array_equal(sqrt, np.sqrt(array))
+    np.testing.assert_array_equal(sqrt, np.sqrt(array))
 
     abs_ = np.abs(d1)
     assert isinstance(abs_, np.ndarray)
-    assert np.array_equal(abs_, np.abs(array))
+    np.testing.assert_array_equal(abs_, np.abs(array))
 
     max_ = np.max(d1)
     assert isinstance(max_, float)
-    assert np.array_equal(max_, np.max(array))
+    np.testing.assert_array_equal(max_, np.max(array))
+
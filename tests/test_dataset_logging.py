@@ -1,6 +1,5 @@
 import logging
-import os
-import tempfile
+from datetime import datetime
 
 import numpy as np
 import pytest
@@ -15,20 +14,27 @@ from msl.io.dataset_logging import DatasetLogging
 
 logger = logging.getLogger(__name__)
 
-num_initial_handlers = 0
+# the level names of the records that test_create_and_require and test_create_multiple_same_root emit
+_LEVELNAMES = np.array(['DEBUG', 'WARNING', 'INFO', 'CRITICAL', 'ERROR'])
 
+# h5py 3.0+ reads the strings that were written to a file as bytes
+h5py_reads_bytes = h5py is not None and h5py.version.version_tuple.major >= 3
 
-def setup_module():
-    # Set the initial number of logging handlers.
-    # Since pytest has its own this setup() function must be called
-    # when pytest begins to test this module
-    global num_initial_handlers
-    num_initial_handlers = len(logging.getLogger().handlers)
+# the number of records that test_initial_shape emits
+num_records = 1234
 
 
-def test_create():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+@pytest.fixture
+def num_handlers():
+    # pytest adds its own handlers to the root logger, so the number of handlers
+    # is taken when a test starts and the test must restore it when it finishes
+    root_logger = logging.getLogger()
+    n = len(root_logger.handlers)
+    yield n
+    assert len(root_logger.handlers) == n
 
+
+def test_create(num_handlers):
     root = JSONWriter()
 
     # also checks that specifying the level as a int is okay
@@ -37,9 +43,9 @@ def test_create():
     assert dset.name == '/log'
     assert root.is_dataset(dset)
     assert isinstance(dset, DatasetLogging)
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 1
+    assert len(logging.getLogger().handlers) == num_handlers + 1
     assert len(dset) == 0
-    assert np.array_equal(dset.dtype.names, ('asctime', 'levelname', 'name', 'message'))
+    assert dset.dtype.names == ('asctime', 'levelname', 'name', 'message')
     assert len(dset.metadata) == 3
     assert dset.metadata['logging_level'] == logging.INFO
     assert dset.metadata.logging_level_name == 'INFO'
@@ -54,21 +60,19 @@ def test_create():
     assert dset[ dset['levelname'] == 'ERROR']['message'] == 'bar'
 
     dset.remove_handler()
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_create_and_require():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+def test_create_and_require(num_handlers):
     root = JSONWriter()
     dset = root.create_dataset_logging('/a/b/log', level=logging.DEBUG)
 
     assert dset.name == '/a/b/log'
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 1
+    assert len(logging.getLogger().handlers) == num_handlers + 1
 
     with pytest.raises(ValueError):
         root.create_dataset_logging(dset.name)
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 1
+    assert len(logging.getLogger().handlers) == num_handlers + 1
 
     assert not dset.read_only
     assert root.is_dataset(dset)
@@ -92,7 +96,7 @@ def test_create_and_require():
     logger.error(messages[4])
 
     assert len(dset) == 5
-    assert np.array_equal(dset['levelname'], ['DEBUG', 'WARNING', 'INFO', 'CRITICAL', 'ERROR'])
+    assert np.array_equal(dset['levelname'], _LEVELNAMES)
     assert np.array_equal(dset['message'], messages)
 
     b = root.a.b
@@ -100,21 +104,20 @@ def test_create_and_require():
     assert dset2 is dset
 
     logger.info('another info message')
-    assert np.array_equal(dset['levelname'], ['DEBUG', 'WARNING', 'INFO', 'CRITICAL', 'ERROR', 'INFO'])
+    assert np.array_equal(dset['levelname'][:-1], _LEVELNAMES)
+    assert dset['levelname'][-1] == 'INFO'
     assert np.array_equal(dset['message'], messages + ['another info message'])
 
     dset.remove_handler()
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    assert len(logging.getLogger().handlers) == num_handlers
 
 
-def test_create_multiple_same_root():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+def test_create_multiple_same_root(num_handlers):
     root = JSONWriter()
     dset1 = root.create_dataset_logging('log')
 
     assert dset1.name == '/log'
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 1
+    assert len(logging.getLogger().handlers) == num_handlers + 1
 
     messages = [
         'a debug message',
@@ -131,7 +134,7 @@ def test_create_multiple_same_root():
     dset2 = xx.create_dataset_logging('log', level=logging.WARNING, attributes=['funcName', 'levelno'])
     assert dset2.name == '/xx/log'
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 2
+    assert len(logging.getLogger().handlers) == num_handlers + 2
 
     logger.info(messages[2])
     logger.critical(messages[3])
@@ -139,7 +142,7 @@ def test_create_multiple_same_root():
 
     assert dset1.level == logging.INFO
     assert len(dset1) == 4  # the DEBUG message is not there
-    assert np.array_equal(dset1['levelname'], ['WARNING', 'INFO', 'CRITICAL', 'ERROR'])
+    assert np.array_equal(dset1['levelname'], _LEVELNAMES[1:])
     assert np.array_equal(dset1['message'], messages[1:])
 
     assert dset2.level == logging.WARNING
@@ -150,17 +153,15 @@ def test_create_multiple_same_root():
     dset1.remove_handler()
     dset2.remove_handler()
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_requires_failures():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+def test_requires_failures(num_handlers):
     root = JSONWriter()
     root.create_dataset('regular')
     root.create_dataset_logging('logging')
 
-    assert np.array_equal(root.logging.dtype.names, ['asctime', 'levelname', 'name', 'message'])
+    assert root.logging.dtype.names == ('asctime', 'levelname', 'name', 'message')
     with pytest.raises(ValueError, match=r"does not equal \('lineno', 'filename'\)"):
         root.require_dataset_logging('logging', attributes=['lineno', 'filename'])
 
@@ -168,12 +169,10 @@ def test_requires_failures():
         root.require_dataset_logging('regular')
 
     root.logging.remove_handler()
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    assert len(logging.getLogger().handlers) == num_handlers
 
 
-def test_filter_loggers():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+def test_filter_loggers(num_handlers):
     unlogger = logging.getLogger('unwanted')
 
     root = JSONWriter()
@@ -188,14 +187,12 @@ def test_filter_loggers():
 
     dset.remove_handler()
     del logging.Logger.manager.loggerDict['unwanted']
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_save_then_read():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
-    json = JSONWriter(file=os.path.join(tempfile.gettempdir(), 'msl-io-junk.json'))
-    h5 = HDF5Writer(file=os.path.join(tempfile.gettempdir(), 'msl-io-junk.h5'))
+def test_save_then_read(tmp_path, num_handlers):
+    json = JSONWriter(file=str(tmp_path / 'msl-io-junk.json'))
+    h5 = HDF5Writer(file=str(tmp_path / 'msl-io-junk.h5'))
 
     json.create_dataset_logging('log', date_fmt='%H:%M:%S', extra='ABC')
     h5.require_dataset_logging('/a/b/c/d/e/log')  # doesn't exist so creates it
@@ -213,8 +210,6 @@ def test_save_then_read():
     json_2 = read(json.file)
     if h5py is not None:
         h5_2 = read(h5.file)
-        os.remove(h5.file)
-    os.remove(json.file)
 
     # when a file is read, what was once a DatasetLogging object is loaded as a regular Dataset
     # but can be turned back into a DatasetLogging by calling require_dataset_logging()
@@ -250,16 +245,8 @@ def test_save_then_read():
 
     assert np.array_equal(json_2.log['message'], ['hello world', 'foo'])
     if h5py is not None:
-        if h5py.version.version_tuple.major < 3:
-            assert np.array_equal(
-                h5_2.a.b.c.d.e.log['message'],
-                ['hello world', 'foo']
-            )
-        else:
-            assert np.array_equal(
-                h5_2.a.b.c.d.e.log['message'],
-                [b'hello world', b'foo']
-            )
+        h5_read = [b'hello world', b'foo'] if h5py_reads_bytes else ['hello world', 'foo']
+        assert np.array_equal(h5_2.a.b.c.d.e.log['message'].tolist(), h5_read)
 
     json.log.remove_handler()
 
@@ -268,16 +255,7 @@ def test_save_then_read():
     assert np.array_equal(h5.a.b.c.d.e.log['message'], ['hello world', 'foo', 'baz'])
     assert np.array_equal(json_2.log['message'], ['hello world', 'foo', 'baz'])
     if h5py is not None:
-        if h5py.version.version_tuple.major < 3:
-            assert np.array_equal(
-                h5_2.a.b.c.d.e.log['message'],
-                ['hello world', 'foo', 'baz']
-            )
-        else:
-            assert np.array_equal(
-                h5_2.a.b.c.d.e.log['message'].tolist(),
-                [b'hello world', b'foo', 'baz']
-            )
+        assert np.array_equal(h5_2.a.b.c.d.e.log['message'].tolist(), h5_read + ['baz'])
 
     h5.a.b.c.d.e.log.remove_handler()
 
@@ -287,27 +265,16 @@ def test_save_then_read():
     assert np.array_equal(h5.a.b.c.d.e.log['message'], ['hello world', 'foo', 'baz'])
     assert np.array_equal(json_2.log['message'], ['hello world', 'foo', 'baz', 'ooops...', 'YIKES!'])
     if h5py is not None:
-        if h5py.version.version_tuple.major < 3:
-            assert np.array_equal(
-                h5_2.a.b.c.d.e.log['message'],
-                ['hello world', 'foo', 'baz', 'ooops...', 'YIKES!']
-            )
-        else:
-            assert np.array_equal(
-                h5_2.a.b.c.d.e.log['message'].tolist(),
-                [b'hello world', b'foo', 'baz', 'ooops...', 'YIKES!']
-            )
+        assert np.array_equal(h5_2.a.b.c.d.e.log['message'].tolist(), h5_read + ['baz', 'ooops...', 'YIKES!'])
 
     json_2.log.remove_handler()
     if h5py is not None:
         h5_2.a.b.c.d.e.log.remove_handler()
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    assert len(logging.getLogger().handlers) == num_handlers
 
 
-def test_all_attributes():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+def test_all_attributes(num_handlers):
     attributes = [
         'asctime', 'created', 'filename', 'funcName', 'levelname',
         'levelno', 'lineno', 'message', 'module', 'msecs', 'name', 'pathname',
@@ -332,21 +299,19 @@ def test_all_attributes():
     logger.critical('c r i t i c a l')
 
     assert len(dset) == 5
-    assert len(dset[dset['levelno'] > logging.DEBUG]) == 4
-    assert len(dset[dset['levelno'] > logging.INFO]) == 3
-    assert len(dset[dset['levelno'] > logging.WARNING]) == 2
-    assert len(dset[dset['levelno'] > logging.ERROR]) == 1
-    assert len(dset[dset['levelno'] > logging.CRITICAL]) == 0
-    assert np.array_equal(dset.dtype.names, attributes)
+    assert np.count_nonzero(dset['levelno'] > logging.DEBUG) == 4
+    assert np.count_nonzero(dset['levelno'] > logging.INFO) == 3
+    assert np.count_nonzero(dset['levelno'] > logging.WARNING) == 2
+    assert np.count_nonzero(dset['levelno'] > logging.ERROR) == 1
+    assert np.count_nonzero(dset['levelno'] > logging.CRITICAL) == 0
+    assert dset.dtype.names == tuple(attributes)
 
     dset.remove_handler()
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_is_logging_dataset():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+def test_is_logging_dataset(num_handlers):
     root = JSONWriter()
     root.create_dataset('/a/b/regular')
     root.create_dataset_logging('log')
@@ -354,25 +319,23 @@ def test_is_logging_dataset():
     root.create_dataset_logging('/a/b/log')
     root.create_dataset_logging('/a/b/log2')
 
-    log_dsets = [dset for dset in root.datasets() if root.is_dataset_logging(dset)]
+    datasets = list(root.datasets())
+    log_dsets = [dset for dset in datasets if root.is_dataset_logging(dset)]
 
     assert len(list(root.items())) == 7
     assert len(list(root.descendants())) == 2
-    assert len(list(root.datasets())) == 5
+    assert len(datasets) == 5
     assert len(log_dsets) == 3
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 3
+    assert len(logging.getLogger().handlers) == num_handlers + 3
 
-    for dset in root.datasets():
-        if root.is_dataset_logging(dset):
-            dset.remove_handler()
-
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    for dset in log_dsets:
+        dset.remove_handler()
 
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_invalid_attributes():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+def test_invalid_attributes(num_handlers):
     root = JSONWriter()
 
     # cannot be an empty list/tuple
@@ -387,67 +350,68 @@ def test_invalid_attributes():
     with pytest.raises(ValueError):
         root.create_dataset_logging('log', attributes=['1', '2', 3])
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    assert len(logging.getLogger().handlers) == num_handlers
 
 
-def test_initial_shape():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+@pytest.fixture(scope='module')
+def initial_shape():
+    # emit the records once to all datasets, the test cases then check one dataset each
+    n = len(logging.getLogger().handlers)
 
     root = JSONWriter()
+    root.create_dataset_logging('log1', shape=(10000,))
+    root.create_dataset_logging('log2')
+    root.create_dataset_logging('log3', size=256)
+    root.create_dataset_logging('log4', size=0)
 
-    num_records = 1234
-
-    log1 = root.create_dataset_logging('log1', shape=(10000,))
-    log2 = root.create_dataset_logging('log2')
-    log3 = root.create_dataset_logging('log3', size=256)
-    log4 = root.create_dataset_logging('log4', size=0)
-
-    # the shape is an argument of Dataset and does not get passed to the Metadata
-    assert 'shape' not in log1.metadata
-
-    # specifying the `size` gets popped from the kwarg and gets converted to a `shape` kwarg
-    assert 'size' not in log3.metadata
-    assert 'shape' not in log3.metadata
-
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 4
+    assert len(logging.getLogger().handlers) == n + 4
 
-    assert len(log1) == 10000
-    assert len(log2) == 0
-    assert len(log3) == 256
-    assert len(log4) == 0
+    datasets = list(root.datasets())
+    lengths = {}
+    for dset in datasets:
+        lengths[dset.name] = [len(dset)]
 
     for i in range(num_records):
         logging.info(i)  # just to be different, use the root logger
 
-    assert len(log1) == 10000
-    assert len(log2) == num_records
-    assert len(log3) == 1380
-    assert len(log4) == 1267
+    for dset in datasets:
+        lengths[dset.name].append(len(dset))
+        dset.remove_handler()
 
-    for dset in root.datasets():
-        dset.remove_empty_rows()
+    assert len(logging.getLogger().handlers) == n
+    return root, lengths
 
-    assert len(log1) == num_records
-    assert len(log2) == num_records
-    assert len(log3) == num_records
-    assert len(log4) == num_records
 
-    for i in range(num_records):
-        assert int(log1[i][3]) == i
-        assert int(log2[i][3]) == i
-        assert int(log3[i][3]) == i
-        assert int(log4[i][3]) == i
+def test_initial_shape_metadata(initial_shape):
+    root, _ = initial_shape
 
-    for dset in root.datasets():
-        dset.remove_handler()
+    # the shape is an argument of Dataset and does not get passed to the Metadata
+    assert 'shape' not in root.log1.metadata
+
+    # specifying the `size` gets popped from the kwarg and gets converted to a `shape` kwarg
+    assert 'size' not in root.log3.metadata
+    assert 'shape' not in root.log3.metadata
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+@pytest.mark.parametrize(
+    ('name', 'initial_length', 'length'),
+    [('/log1', 10000, 10000),
+     ('/log2', 0, num_records),
+     ('/log3', 256, 1380),
+     ('/log4', 0, 1267)]
+)
+def test_initial_shape(initial_shape, name, initial_length, length):
+    root, lengths = initial_shape
+    assert lengths[name] == [initial_length, length]
 
-def test_initial_index_value():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    dset = root[name]
+    dset.remove_empty_rows()
+    assert len(dset) == num_records
+    assert np.array_equal(dset['message'], [str(i) for i in range(num_records)])
 
-    root = JSONWriter(file=os.path.join(tempfile.gettempdir(), 'msl-io-junk.json'))
+
+def test_initial_index_value(tmp_path, num_handlers):
+    root = JSONWriter(file=str(tmp_path / 'msl-io-junk.json'))
     root.create_dataset_logging('log')
 
     n = 10
@@ -469,9 +433,7 @@ def test_initial_index_value():
     # also specify shape as an integer which gets cast to a 1-d tuple
     root3.require_dataset_logging(root.log.name, shape=n-5)
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers + 3
-
-    os.remove(root.file)
+    assert len(logging.getLogger().handlers) == num_handlers + 3
 
     assert root2.log.size == n+5
     assert root3.log.size == n  # gets increased to n
@@ -508,22 +470,127 @@ def test_initial_index_value():
     assert root2.log.size == 2*n
     assert root3.log.size == 3*n
 
-    messages1 = root['log']['message']
-    messages2 = root2['log']['message']
-    messages3 = root3['log']['message']
-    for i in range(3*n):
-        if i < n:
-            assert messages1[i] == 'message %d' % i
-        if i < 2*n:
-            assert messages2[i] == 'message %d' % i
-        assert messages3[i] == 'message %d' % i
+    expected = np.array(['message %d' % i for i in range(3*n)])
+    assert np.array_equal(root['log']['message'], expected[:n])
+    assert np.array_equal(root2['log']['message'], expected[:2*n])
+    assert np.array_equal(root3['log']['message'], expected)
 
     root3['log'].remove_handler()
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    assert len(logging.getLogger().handlers) == num_handlers
 
 
-def test_invalid_shape_or_size():
+def test_append_without_initial_size(num_handlers):
+    root = JSONWriter()
+    dset = root.create_dataset_logging('log')
+
+    for i in range(100):
+        logger.info('message %d', i)
+        assert len(dset) == i + 1
+
+    # only the rows that contain a record are visible
+    assert dset.shape == (100,)
+    assert np.array_equal(dset['message'], ['message %d' % i for i in range(100)])
+
+    # an array that was previously returned by the data property is not
+    # changed by a new record and it does not include the new record
+    data = dset.data
+    logger.info('message 100')
+    assert dset.shape == (101,)
+    assert data.shape == (100,)
+    assert np.array_equal(data['message'], ['message %d' % i for i in range(100)])
+    assert dset['message'][100] == 'message 100'
+
+    # modifying a row in the Dataset is not undone by the next record
+    dset['message'][0] = 'modified'
+    logger.info('message 101')
+    assert dset['message'][0] == 'modified'
+
+    # records are still appended after the data is replaced by remove_empty_rows()
+    dset.remove_empty_rows()
+    for i in range(102, 110):
+        logger.info('message %d', i)
+
+    assert dset.shape == (110,)
+    assert dset['message'][0] == 'modified'
+    assert np.array_equal(dset['message'][1:], ['message %d' % i for i in range(1, 110)])
+
+    dset.remove_handler()
+    assert len(logging.getLogger().handlers) == num_handlers
+
+
+def test_append_keep_data_reference(num_handlers):
+    root = JSONWriter()
+    dset = root.create_dataset_logging('log')
+
+    logger.info('message 0')
+    data = dset.data
+
+    # while the internal array has room for more records the previous data shares memory
+    logger.info('message 1')
+    assert np.shares_memory(data, dset.data)
+    data['message'][0] = 'shared'
+    assert dset['message'][0] == 'shared'
+
+    # the internal array is reallocated, the previous data no longer shares memory
+    for i in range(2, 10):
+        logger.info('message %d', i)
+    assert not np.shares_memory(data, dset.data)
+    assert data.shape == (1,)
+    data['message'][0] = 'not shared'
+    assert dset['message'][0] == 'shared'
+    assert np.array_equal(dset['message'][1:], ['message %d' % i for i in range(1, 10)])
+
+    # remove_empty_rows() replaces the data while the internal array still has room for
+    # more records, a row that is modified afterwards must be kept by the next record
+    dset.remove_empty_rows()
+    data = dset.data
+    data['message'][0] = 'modified'
+    logger.info('message 10')
+    assert dset.shape == (11,)
+    assert data.shape == (10,)
+    assert not np.shares_memory(data, dset.data)
+    assert dset['message'][0] == 'modified'
+    assert np.array_equal(dset['message'][1:], ['message %d' % i for i in range(1, 11)])
+
+    dset.remove_handler()
+    assert len(logging.getLogger().handlers) == num_handlers
+
+
+def test_sequence_attribute(num_handlers):
+    root = JSONWriter()
+    dset = root.create_dataset_logging('log', attributes=['args', 'message'])
+
+    logger.info('%s and %s', 'x', 1)
+
+    # a sequence value of an attribute is stored as a single object in the row
+    assert dset['args'][0] == ('x', 1)
+    assert dset['message'][0] == 'x and 1'
+
+    dset.remove_handler()
+    assert len(logging.getLogger().handlers) == num_handlers
+
+
+def test_asctime(num_handlers):
+    root = JSONWriter()
+    date_fmts = ['%Y-%m-%dT%H:%M:%S.%f', '%H:%M:%S', '%f|%S|%f', '%Y %%f %f']
+    for i, date_fmt in enumerate(date_fmts):
+        root.create_dataset_logging('log%d' % i, attributes=['created', 'asctime'], date_fmt=date_fmt)
+
+    for i in range(10):
+        logger.info('message %d', i)
+
+    for i, date_fmt in enumerate(date_fmts):
+        dset = root['log%d' % i]
+        assert len(dset) == 10
+        for created, asctime in dset:
+            assert asctime == datetime.fromtimestamp(created).strftime(date_fmt)
+        dset.remove_handler()
+
+    assert len(logging.getLogger().handlers) == num_handlers
+
+
+def test_invalid_shape_or_size(num_handlers):
     root = JSONWriter()
 
     with pytest.raises(ValueError, match=r'Invalid shape'):
@@ -541,12 +608,10 @@ def test_invalid_shape_or_size():
     with pytest.raises(ValueError, match=r'Invalid shape'):
         root.create_dataset_logging('log', size=-1)
 
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_set_logger():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+def test_set_logger(num_handlers):
     root = JSONWriter()
     root.create_dataset_logging('log')
 
@@ -556,12 +621,10 @@ def test_set_logger():
 
     root.log.set_logger(logger)
     root.log.remove_handler()
-    assert len(logging.getLogger().handlers) == num_initial_handlers
-
+    assert len(logging.getLogger().handlers) == num_handlers
 
-def test_hash():
-    assert len(logging.getLogger().handlers) == num_initial_handlers
 
+def test_hash(num_handlers):
     root = JSONWriter()
     root.create_dataset_logging('log')
 
@@ -569,4 +632,4 @@ def test_hash():
     assert isinstance(hash(root.log), int)
 
     root.log.remove_handler()
-    assert len(logging.getLogger().handlers) == num_initial_handlers
+    assert len(logging.getLogger().handlers) == num_handlers
@@ -1,9 +1,16 @@
+import pytest
+
 from helper import read_sample
 from msl.io.readers import DRSReader
 
 
-def test_drs():
-    root = read_sample('Lamp_15082018_4.DAT')
+@pytest.fixture(scope='module')
+def root():
+    # the file is parsed once and shared by the (read-only) tests in this module
+    return read_sample('Lamp_15082018_4.DAT')
+
+
+def test_drs_structure(root):
     assert isinstance(root, DRSReader)
 
     assert 'run1' in root
@@ -15,6 +22,8 @@ def test_drs():
     assert 'run4' in root
     assert 'scan1' in root['run4']
 
+
+def test_drs_metadata(root):
     assert root['run1'].metadata['wavelength_start'] == 600
     assert root['run2'].metadata['wavelength_start'] == 700
     assert root['run3'].metadata['wavelength_increment'] == 50
@@ -27,6 +36,8 @@ def test_drs():
     assert root.run3.metadata.devices['LAMP 1']['Name'] == 'F637'
     assert root.run3.metadata.devices['LAMP 2']['Name'] == 'F636'
 
+
+def test_drs_run1_data(root):
     dat = root['run1']['scan1']['dat']
     log636 = root['run1']['scan1']['log-F636']
     log637 = root['run1']['scan1']['log-F637']
@@ -37,6 +48,8 @@ def test_drs():
     assert dat['u(F636)'][1] == 0.00066831
     assert abs(log636.wavelength[0] - 600) < 0.001
 
+
+def test_drs_run3_data(root):
     dat = root['run3']['scan1']['dat']
     log636 = root['run3']['scan1']['log-F636']
     log637 = root['run3']['scan1']['log-F637']
@@ -1,7 +1,6 @@
 import io
 import os
 import sys
-import tempfile
 import uuid
 from datetime import datetime
 
@@ -12,70 +11,15 @@ try:
 except ImportError:
     HttpError = Exception
 
-from msl.io.constants import IS_PYTHON2
 from msl.io.google_api import GCell
 from msl.io.google_api import GCellType
-from msl.io.google_api import GDrive
-from msl.io.google_api import GMail
 from msl.io.google_api import GSheets
 from msl.io.google_api import GValueOption
 
-# all Google API tests require the necessary "token.json" file to be
-# available for a specific Google user's account
-try:
-    # dr -> drive, readonly
-    dr = GDrive(account='testing', read_only=True)
-except:
-    dr = None
-
-try:
-    # dw -> drive, writable
-    dw = GDrive(account='testing', read_only=False)
-except:
-    dw = None
-
-try:
-    # sr -> sheets, readonly
-    sr = GSheets(account='testing', read_only=True)
-except:
-    sr = None
-
-try:
-    # sw -> sheets, writeable
-    sw = GSheets(account='testing', read_only=False)
-except:
-    sw = None
-
-try:
-    gmail = GMail(account='testing')
-except:
-    gmail = None
-
-skipif_no_gdrive_readonly = pytest.mark.skipif(
-    dr is None, reason='No GDrive readonly token'
-)
-
-skipif_no_gdrive_writeable = pytest.mark.skipif(
-    dw is None, reason='No GDrive writable token'
-)
-
-skipif_no_sheets_readonly = pytest.mark.skipif(
-    sr is None, reason='No GSheets readonly token'
-)
-
-skipif_no_sheets_writeable = pytest.mark.skipif(
-    sw is None, reason='No GSheets writeable token'
-)
-
-skipif_no_gmail = pytest.mark.skipif(
-    gmail is None, reason='No Gmail token'
-)
-
 IS_WINDOWS = sys.platform == 'win32'
 
 
-@skipif_no_sheets_readonly
-def test_gsheets_sheet_names():
+def test_gsheets_sheet_names(sr):
     # MSL/msl-io-testing/empty-5.gsheet
     names = sr.sheet_names('1Ua15pRGUH5qoU0c3Ipqrkzi9HBlm3nzqCn5O1IONfCY')
     assert len(names) == 5
@@ -101,14 +45,23 @@ def test_gsheets_sheet_names():
     assert 'row' in names
 
 
-@skipif_no_sheets_readonly
-def test_gsheets_values():
+# MSL/msl-io-testing/f 1/f2/sub folder 3/lab environment
+_LAB_ID = '1FwzsFgN7w-HZXOlUAEMVMSOGpNHCj5NXvH6Xl7LyLp4'
+
+# the (formatted) values in the only sheet of the lab environment spreadsheet
+_LAB_VALUES = [
+    ['Timestamp', 'Temperature', 'Humidity'],
+    ['2021-04-03 12:36:10', '20.33', '49.82'],
+    ['2021-04-03 12:37:10', '20.23', '46.06'],
+    ['2021-04-03 12:38:10', '20.41', '47.06'],
+    ['2021-04-03 12:39:10', '20.29', '48.32']
+]
+
+
+def test_gsheets_values(sr):
     # MSL/msl-io-testing/empty-5
     empty_id = '1Ua15pRGUH5qoU0c3Ipqrkzi9HBlm3nzqCn5O1IONfCY'
 
-    # MSL/msl-io-testing/f 1/f2/sub folder 3/lab environment
-    lab_id = '1FwzsFgN7w-HZXOlUAEMVMSOGpNHCj5NXvH6Xl7LyLp4'
-
     # more than 1 sheet exists
     with pytest.raises(ValueError, match=r'You must specify a sheet name:'):
         sr.values(empty_id)
@@ -126,38 +79,26 @@ def test_gsheets_values():
 
     # only 1 sheet exists, therefore we do not need to specify
     # a value for the 'sheet' kwarg since it is determined automatically
-    expected = [
-        ['Timestamp', 'Temperature', 'Humidity'],
-        ['2021-04-03 12:36:10', '20.33', '49.82'],
-        ['2021-04-03 12:37:10', '20.23', '46.06'],
-        ['2021-04-03 12:38:10', '20.41', '47.06'],
-        ['2021-04-03 12:39:10', '20.29', '48.32']
-    ]
-    values = sr.values(lab_id)
-    assert values == expected
+    values = sr.values(_LAB_ID)
+    assert values == _LAB_VALUES
 
-    values = sr.values(lab_id, row_major=False)
-    assert values == [
-        ['Timestamp', '2021-04-03 12:36:10', '2021-04-03 12:37:10', '2021-04-03 12:38:10', '2021-04-03 12:39:10'],
-        ['Temperature', '20.33', '20.23', '20.41', '20.29'],
-        ['Humidity', '49.82', '46.06', '47.06', '48.32']
-    ]
+    values = sr.values(_LAB_ID, row_major=False)
+    assert values == [list(column) for column in zip(*_LAB_VALUES)]
 
-    values = sr.values(lab_id, cells='B2:C4', value_option='FORMATTED_VALUE')
-    assert values == [['20.33', '49.82'], ['20.23', '46.06'], ['20.41', '47.06']]
+    values = sr.values(_LAB_ID, cells='B2:C4', value_option='FORMATTED_VALUE')
+    assert values == [row[1:3] for row in _LAB_VALUES[1:4]]
 
-    values = sr.values(lab_id, cells='B:B', value_option='UNFORMATTED_VALUE')
+    values = sr.values(_LAB_ID, cells='B:B', value_option='UNFORMATTED_VALUE')
     assert values == [['Temperature'], [20.33], [20.23], [20.41], [20.29]]
 
-    values = sr.values(lab_id, cells='B:C', value_option=GValueOption.UNFORMATTED)
+    values = sr.values(_LAB_ID, cells='B:C', value_option=GValueOption.UNFORMATTED)
     assert values == [['Temperature', 'Humidity'], [20.33, 49.82], [20.23, 46.06], [20.41, 47.06], [20.29, 48.32]]
 
-    values = sr.values(lab_id, cells='A2:C2')
-    assert values == [expected[1]]
+    values = sr.values(_LAB_ID, cells='A2:C2')
+    assert values == [_LAB_VALUES[1]]
 
 
-@skipif_no_sheets_readonly
-def test_gsheets_to_datetime():
+def test_gsheets_to_datetime(sr):
     expected = [
         ['Timestamp', datetime(2021, 4, 3, 12, 36, 10), datetime(2021, 4, 3, 12, 37, 10),
          datetime(2021, 4, 3, 12, 38, 10), datetime(2021, 4, 3, 12, 39, 10)],
@@ -165,20 +106,17 @@ def test_gsheets_to_datetime():
         ['Humidity', 49.82, 46.06, 47.06, 48.32]
     ]
 
-    # MSL/msl-io-testing/f 1/f2/sub folder 3/lab environment
-    lab_id = '1FwzsFgN7w-HZXOlUAEMVMSOGpNHCj5NXvH6Xl7LyLp4'
-    values = sr.values(lab_id, value_option='UNFORMATTED_VALUE', row_major=False)
+    values = sr.values(_LAB_ID, value_option='UNFORMATTED_VALUE', row_major=False)
     values[0][1:] = [sr.to_datetime(t) for t in values[0][1:]]
     assert values == expected
 
-    values = sr.values(lab_id, value_option='UNFORMATTED_VALUE',
+    values = sr.values(_LAB_ID, value_option='UNFORMATTED_VALUE',
                        datetime_option='FORMATTED_STRING', row_major=False)
     expected[0][1:] = [str(t) for t in expected[0][1:]]
     assert values == expected
 
 
-@skipif_no_sheets_readonly
-def test_gsheets_cells():
+def test_gsheets_cells(sr):
     # MSL/msl-io-testing/empty-5
     empty_id = '1Ua15pRGUH5qoU0c3Ipqrkzi9HBlm3nzqCn5O1IONfCY'
 
@@ -302,9 +240,7 @@ def test_gsheets_cells():
     assert values[17][1] == GCell(value=12345.6789, type=GCellType.NUMBER, formatted='12345 55/81')
 
 
-@skipif_no_sheets_writeable
-@skipif_no_gdrive_writeable
-def test_gsheets_create_move_delete():
+def test_gsheets_create_move_delete(sw, dw):
     sid = sw.create('no-sheet-names')
     assert sw.sheet_names(sid) == ('Sheet1',)
     dw.delete(sid)
@@ -318,41 +254,35 @@ def test_gsheets_create_move_delete():
     dw.delete(dw.folder_id('My Drive/eat'))
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_shared_drives():
+def test_gdrive_shared_drives(dr):
     assert dr.shared_drives() == {}
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_folder_id_exception():
-    # the folder does not exist
-    folders = [
-        'DoesNotExist',
-        '/Google Drive/MSL/DoesNotExist',
-    ]
-    if IS_WINDOWS:
-        folders.append(r'C:\Users\username\Google Drive\MSL\DoesNotExist')
-    for folder in folders:
-        with pytest.raises(OSError, match=r'Not a valid Google Drive folder'):
-            dr.folder_id(folder)
-
-    # specified a valid file (which is not a folder)
-    files = [
-        'Single-Photon Generation and Detection.pdf',
-        'MSL/msl-io-testing/unique'
-    ]
-    for file in files:
-        with pytest.raises(OSError, match=r'Not a valid Google Drive folder'):
-            dr.folder_id(file)
+# the folder does not exist or a valid file (which is not a folder) was specified
+_NOT_FOLDERS = [
+    'DoesNotExist',
+    '/Google Drive/MSL/DoesNotExist',
+    'Single-Photon Generation and Detection.pdf',
+    'MSL/msl-io-testing/unique',
+]
+if IS_WINDOWS:
+    _NOT_FOLDERS.append(r'C:\Users\username\Google Drive\MSL\DoesNotExist')
+
 
+@pytest.mark.parametrize('folder', _NOT_FOLDERS)
+def test_gdrive_folder_id_not_a_folder(dr, folder):
+    with pytest.raises(OSError, match=r'Not a valid Google Drive folder'):
+        dr.folder_id(folder)
+
+
+def test_gdrive_folder_id_exception(dr):
     # specify an invalid parent ID
     assert dr.folder_id('MSL') == '14GYO5FIKmkjo9aCQGysOsxwkTtpoJODi'
     with pytest.raises(HttpError):
         dr.folder_id('MSL', parent_id='INVALID_Kmkjo9aCQGysOsxwkTtpoJODi')
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_folder_id():
+def test_gdrive_folder_id(dr):
     # relative to the root folder
     assert dr.folder_id('') == 'root'
     assert dr.folder_id('/') == 'root'
@@ -378,51 +308,48 @@ def test_gdrive_folder_id():
     assert dr.folder_id('sub folder 3', parent_id='1NRD4klmRTQDkh5ZfhnhaHc6hDYfklMJN') == '1wLAPHCOphcOITR37b8UB88eFW_FzeNQB'
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_file_id_exception():
-    # file does not exist
-    files = [
-        'DoesNotExist',
-        '/home/username/Google Drive/DoesNotExist.txt',
-    ]
-    if IS_WINDOWS:
-        files.append(r'C:\Users\username\Google Drive\DoesNotExist.txt')
-    for file in files:
-        with pytest.raises(OSError, match=r'Not a valid Google Drive file'):
-            dr.file_id(file)
-
-    # specified a valid folder (which is not a file)
-    folders = [
-        'MSL',
-        '/Google Drive/MSL',
-    ]
-    if IS_WINDOWS:
-        folders.append(r'C:\Users\username\Google Drive\MSL')
-    for folder in folders:
-        with pytest.raises(OSError, match=r'Not a valid Google Drive file'):
-            dr.file_id(folder)
+# the file does not exist or a valid folder (which is not a file) was specified
+_NOT_FILES = [
+    'DoesNotExist',
+    '/home/username/Google Drive/DoesNotExist.txt',
+    'MSL',
+    '/Google Drive/MSL',
+]
+if IS_WINDOWS:
+    _NOT_FILES.append(r'C:\Users\username\Google Drive\DoesNotExist.txt')
+    _NOT_FILES.append(r'C:\Users\username\Google Drive\MSL')
+
+
+@pytest.mark.parametrize('file', _NOT_FILES)
+def test_gdrive_file_id_not_a_file(dr, file):
+    with pytest.raises(OSError, match=r'Not a valid Google Drive file'):
+        dr.file_id(file)
 
+
+def test_gdrive_file_id_exception(dr):
     # specify an invalid parent ID
     assert dr.file_id('unique', folder_id='1oB5i-YcNCuTWxmABs-w7JenftaLGAG9C') == '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395'
     with pytest.raises(HttpError):
         dr.file_id('unique', folder_id='INVALID_NCuTWxmABs-w7JenftaLGAG9C')
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_file_id():
-    # relative to the root folder
-    files = {
-        'Single-Photon Generation and Detection.pdf': '11yaxZH93B0IhQZwfCeo2dXb-Iduh-4dS',
-        'MSL/msl-io-testing/unique': '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395',
-        '/Google Drive/Single-Photon Generation and Detection.pdf': '11yaxZH93B0IhQZwfCeo2dXb-Iduh-4dS',
-    }
-    if IS_WINDOWS:
-        files[r'C:\Users\username\Google Drive\MSL\msl-io-testing\unique'] = '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395'
-        files['MSL\\msl-io-testing\\f 1\\f2\\New Text Document.txt'] = '1qW1QclelxZtJtKMigCgGH4ST3QoJ9zuP'
+# the IDs of files, relative to the root folder
+_FILE_IDS = {
+    'Single-Photon Generation and Detection.pdf': '11yaxZH93B0IhQZwfCeo2dXb-Iduh-4dS',
+    'MSL/msl-io-testing/unique': '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395',
+    '/Google Drive/Single-Photon Generation and Detection.pdf': '11yaxZH93B0IhQZwfCeo2dXb-Iduh-4dS',
+}
+if IS_WINDOWS:
+    _FILE_IDS[r'C:\Users\username\Google Drive\MSL\msl-io-testing\unique'] = '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395'
+    _FILE_IDS['MSL\\msl-io-testing\\f 1\\f2\\New Text Document.txt'] = '1qW1QclelxZtJtKMigCgGH4ST3QoJ9zuP'
+
 
-    for file, id_ in files.items():
-        assert dr.file_id(file) == id_
+@pytest.mark.parametrize(('file', 'expected'), list(_FILE_IDS.items()))
+def test_gdrive_file_id_root(dr, file, expected):
+    assert dr.file_id(file) == expected
 
+
+def test_gdrive_file_id(dr):
     # relative to a parent folder
     assert dr.file_id('unique', folder_id='1oB5i-YcNCuTWxmABs-w7JenftaLGAG9C') == '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395'
     assert dr.file_id('msl-io-testing/unique', folder_id='14GYO5FIKmkjo9aCQGysOsxwkTtpoJODi') == '1iaLNB_IZNxbFlpy-Z2-22WQGWy4wU395'
@@ -430,8 +357,7 @@ def test_gdrive_file_id():
     assert dr.file_id('f 1/f2/New Text Document.txt', folder_id='1oB5i-YcNCuTWxmABs-w7JenftaLGAG9C') == '1qW1QclelxZtJtKMigCgGH4ST3QoJ9zuP'
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_file_id_multiple():
+def test_gdrive_file_id_multiple(dr):
     # multiple files with the same name in the same folder
     path = 'MSL/msl-io-testing/f 1/electronics.xlsx'
 
@@ -448,9 +374,7 @@ def test_gdrive_file_id_multiple():
         assert dr.file_id(path, mime_type=mime) == id_
 
 
-@skipif_no_gdrive_readonly
-@skipif_no_gdrive_writeable
-def test_gdrive_create_delete_folder():
+def test_gdrive_create_delete_folder(dr, dw):
 
     # instantiated in read-only mode
     with pytest.raises(HttpError, match=r'[iI]nsufficient'):
@@ -503,8 +427,7 @@ def test_gdrive_create_delete_folder():
     dw.delete(id2)
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_is_file():
+def test_gdrive_is_file(dr):
     # relative to the root folder
     assert not dr.is_file('doesnotexist.txt')
     assert not dr.is_file('does/not/exist.txt')
@@ -529,9 +452,7 @@ def test_gdrive_is_file():
         dr.is_file('unique', folder_id='INVALID_NCuTWxmABs-w7JenftaLGAG9C')
 
 
-@skipif_no_sheets_writeable
-@skipif_no_gdrive_writeable
-def test_gsheets_append():
+def test_gsheets_append(sw, dw):
     sid = sw.create('appending')
     sw.append(None, sid)
     sw.append([], sid)
@@ -582,9 +503,7 @@ def test_gsheets_append():
     dw.delete(sid)
 
 
-@skipif_no_sheets_writeable
-@skipif_no_gdrive_writeable
-def test_gsheets_write():
+def test_gsheets_write(sw, dw):
     sid = sw.create('writing')
     sw.write(None, sid, 'A1')
     sw.write([], sid, 'A1')
@@ -612,9 +531,7 @@ def test_gsheets_write():
     dw.delete(sid)
 
 
-@skipif_no_sheets_writeable
-@skipif_no_gdrive_writeable
-def test_gsheets_copy_rename_add_delete():
+def test_gsheets_copy_rename_add_delete(sw, dw):
     id1 = sw.create('spreadsheet1', sheet_names=['a', 'b', 'c'])
     id2 = sw.create('spreadsheet2')
 
@@ -654,9 +571,7 @@ def test_gsheets_copy_rename_add_delete():
     dw.delete(id2)
 
 
-@skipif_no_sheets_writeable
-@skipif_no_gdrive_writeable
-def test_read_only():
+def test_read_only(sw, dw):
     # Although folders cannot be set to be in read-only mode,
     # test that calling is_read_only() does not raise an error
     fid = dw.create_folder('Read Only Test')
@@ -700,8 +615,7 @@ def test_read_only():
     dw.delete(fid)
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_is_folder():
+def test_gdrive_is_folder(dr):
     # relative to the root folder
     assert not dr.is_folder('doesnotexist')
     assert not dr.is_folder('MSL/msl-io-testing/unique')
@@ -723,10 +637,8 @@ def test_gdrive_is_folder():
         dr.is_folder('f2', parent_id='INVALID_F5AhbUb7Lq77qzuBbvZr150X9')
 
 
-@skipif_no_gdrive_readonly
-@skipif_no_gdrive_writeable
-def test_gdrive_upload():
-    temp_file = os.path.join(tempfile.gettempdir(), str(uuid.uuid4()) + '.py')
+def test_gdrive_upload(dr, dw, tmp_path):
+    temp_file = str(tmp_path / (str(uuid.uuid4()) + '.py'))
     with open(temp_file, mode='wt') as fp:
         fp.write('from msl.io import GDrive')
 
@@ -747,22 +659,21 @@ def test_gdrive_upload():
 
     dw.delete(file_id)
     assert not dw.is_file(path)
-    os.remove(temp_file)
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_download():
-    temp_file = os.path.join(tempfile.gettempdir(), str(uuid.uuid4()))
+def test_gdrive_download(dr, tmp_path, monkeypatch):
+    # the files that are saved to the current working directory go to tmp_path
+    monkeypatch.chdir(tmp_path)
+    temp_file = str(tmp_path / 'msl-io-gdrive-download.txt')
 
     file_id = dr.file_id('MSL/msl-io-testing/file.txt')
 
     # cannot be a string IO object
     with pytest.raises(TypeError):
         dr.download(file_id, save_to=io.StringIO())
-    if not IS_PYTHON2:  # in Python 2, str and bytes are the same
-        with pytest.raises(TypeError):
-            dr.download(file_id, save_to=open('junk.txt', mode='wt'))
-        os.remove('junk.txt')  # clean up since it got created before the error was raised
+    with pytest.raises(TypeError):
+        with open('junk.txt', mode='wt') as fp:
+            dr.download(file_id, save_to=fp)
 
     # a BytesIO object
     with io.BytesIO() as buffer:
@@ -775,7 +686,7 @@ def test_gdrive_download():
         dr.download(file_id, save_to=fp)
     with open(temp_file, mode='rt') as fp:
         assert fp.read() == 'in "msl-io-testing"'
-    os.remove(temp_file)  # clean up
+    os.remove(temp_file)  # the file is created again below
 
     # do not specify a value for the 'save_to' kwarg
     # therefore the filename is determined from the remote filename
@@ -784,24 +695,19 @@ def test_gdrive_download():
     dr.download(file_id)
     with open('file.txt', mode='rt') as fp:
         assert fp.read() == 'in "sub folder 3"'
-    os.remove('file.txt')  # clean up
 
     # save to a specific directory, use the remote filename
-    f = os.path.join(tempfile.gettempdir(), 'file.txt')
-    if os.path.isfile(f):
-        os.remove(f)
-    assert not os.path.isfile(f)
-    dr.download(file_id, save_to=tempfile.gettempdir())
-    with open(f, mode='rt') as fp:
+    folder = tmp_path / 'folder'
+    folder.mkdir()
+    dr.download(file_id, save_to=str(folder))
+    with open(str(folder / 'file.txt'), mode='rt') as fp:
         assert fp.read() == 'in "sub folder 3"'
-    os.remove(f)  # clean up
 
     # save to a specific file
     assert not os.path.isfile(temp_file)
     dr.download(file_id, save_to=temp_file)
     with open(temp_file, mode='rb') as fp:
         assert fp.read() == b'in "sub folder 3"'
-    os.remove(temp_file)  # clean up
 
     # use a callback
     def handler(file):
@@ -809,20 +715,16 @@ def test_gdrive_download():
         assert file.total_size == 17
         assert file.resumable_progress == 17
     dr.download(file_id, save_to=temp_file, callback=handler)
-    os.remove(temp_file)  # clean up
 
 
-@skipif_no_gdrive_readonly
-@skipif_no_gdrive_writeable
-def test_gdrive_empty_trash():
+def test_gdrive_empty_trash(dr, dw):
     # instantiated in read-only mode
     with pytest.raises(HttpError, match=r'[iI]nsufficient'):
         dr.empty_trash()
     dw.empty_trash()
 
 
-@skipif_no_gdrive_readonly
-def test_gdrive_path():
+def test_gdrive_path(dr):
     assert dr.path('0AFP6574OTgaaUk9PVA') == 'My Drive'
     assert dr.path('11yaxZH93B0IhQZwfCeo2dXb-Iduh-4dS') == 'My Drive/Single-Photon Generation and Detection.pdf'
     assert dr.path('14GYO5FIKmkjo9aCQGysOsxwkTtpoJODi') == 'My Drive/MSL'
@@ -840,8 +742,7 @@ def test_gdrive_path():
     assert dr.path('1FwzsFgN7w-HZXOlUAEMVMSOGpNHCj5NXvH6Xl7LyLp4') == 'My Drive/MSL/msl-io-testing/f 1/f2/sub folder 3/lab environment'
 
 
-@skipif_no_gdrive_writeable
-def test_gdrive_copy():
+def test_gdrive_copy(dw):
     msl_io_testing_id = '1oB5i-YcNCuTWxmABs-w7JenftaLGAG9C'
     assert dw.path(msl_io_testing_id) == 'My Drive/MSL/msl-io-testing'
 
@@ -885,8 +786,7 @@ def test_gdrive_copy():
     assert dw.is_file('file.txt', folder_id=msl_io_testing_id)
 
 
-@skipif_no_gdrive_writeable
-def test_gdrive_rename():
+def test_gdrive_rename(dw):
     # rename a folder
     fid = dw.create_folder('My Folder')
     assert dw.path(fid) == 'My Drive/My Folder'
@@ -905,8 +805,7 @@ def test_gdrive_rename():
     dw.delete(fid)
 
 
-@skipif_no_gdrive_writeable
-def test_gdrive_move():
+def test_gdrive_move(dw):
     # move a folder
     fid = dw.create_folder('X/Y/Z')
     assert dw.path(fid) == 'My Drive/X/Y/Z'
@@ -925,13 +824,9 @@ def test_gdrive_move():
     dw.delete(dw.folder_id('X'))
 
 
-@skipif_no_gmail
-def test_gmail_profile():
+def test_gmail_profile(gmail):
     profile = gmail.profile()
     assert profile['email_address'].endswith('@gmail.com')
     assert profile['messages_total'] > 1
     assert profile['threads_total'] > 1
-    if IS_PYTHON2:
-        assert isinstance(profile['history_id'], unicode)
-    else:
-        assert isinstance(profile['history_id'], str)
+    assert isinstance(profile['history_id'], str)
@@ -1,41 +1,9 @@
 import os
-from shutil import rmtree
-from tempfile import mkdtemp
 
-import pytest
 
-from msl.io.google_api import GDrive
-from msl.io.google_api import GSheets
-
-# all Google API tests require the necessary "token.json" file to be
-# available for a specific Google user's account
-try:
-    drive = GDrive(account='demo', read_only=False)
-    sheet = GSheets(account='demo', read_only=False)
-except:
-    drive = None
-    sheet = None
-
-
-TMP_DIR = ''
-
-
-def setup_module():
-    global TMP_DIR
-    TMP_DIR = mkdtemp(prefix='msl-io-test-')
-
-
-def teardown_module():
-    rmtree(TMP_DIR)
-    if sheet is not None:
-        sheet.close()
-    if drive is not None:
-        drive.close()
-
-
-@pytest.mark.skipif(drive is None, reason='No GDrive CI demo account token')
-@pytest.mark.skipif(sheet is None, reason='No GSheets CI demo account token')
-def test_drive_sheets():
+def test_drive_sheets(demo_drive, demo_sheets, tmp_path):
+    drive, sheet = demo_drive, demo_sheets
+    tmp_dir = str(tmp_path)
     filename = os.path.basename(__file__)
     drives = drive.shared_drives()
     drive_id = next(iter(drives))
@@ -74,12 +42,12 @@ def test_drive_sheets():
     assert drive.is_file('help/' + filename, folder_id=files_id) is True
     assert drive.is_file(filename, folder_id=help_id) is True
     assert drive.is_file('help/' + filename) is False
-    assert not os.path.isfile(os.path.join(TMP_DIR, filename))
-    drive.download(f_id, save_to=TMP_DIR)
-    assert os.path.isfile(os.path.join(TMP_DIR, filename))
-    assert not os.path.isfile(os.path.join(TMP_DIR, 'new.py'))
-    drive.download(f_id, save_to=os.path.join(TMP_DIR, 'new.py'))
-    assert os.path.isfile(os.path.join(TMP_DIR, 'new.py'))
+    assert not os.path.isfile(os.path.join(tmp_dir, filename))
+    drive.download(f_id, save_to=tmp_dir)
+    assert os.path.isfile(os.path.join(tmp_dir, filename))
+    assert not os.path.isfile(os.path.join(tmp_dir, 'new.py'))
+    drive.download(f_id, save_to=os.path.join(tmp_dir, 'new.py'))
+    assert os.path.isfile(os.path.join(tmp_dir, 'new.py'))
     drive.move(f_id, 'root')
     assert drive.path(f_id) == 'My Drive/' + filename
     drive.move(f_id, files_id)
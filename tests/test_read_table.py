@@ -15,8 +15,6 @@ from msl.io import read_table
 from msl.io.constants import IS_PYTHON2
 from msl.io.tables import read_table_excel
 from msl.io.tables import read_table_gsheets
-from test_google_api import skipif_no_gdrive_readonly
-from test_google_api import skipif_no_sheets_readonly
 
 skipif_32bit_py27 = pytest.mark.skipif(
     sys.maxsize < 2**32 and IS_PYTHON2,
@@ -330,8 +328,7 @@ def test_pathlib():
 
 
 @skipif_32bit_py27
-@skipif_no_gdrive_readonly
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('dr', 'sr')
 def test_gsheet_file_path():
     dset = read_table('table.gsheet', account='testing', sheet='StartA1')
     assert np.array_equal(dset.metadata.header, gsheet_header)
@@ -343,8 +340,7 @@ def test_gsheet_file_path():
 
 
 @skipif_32bit_py27
-@skipif_no_gdrive_readonly
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('dr', 'sr')
 def test_gsheet_pathlib():
     dset = read_table(pathlib.Path('table.gsheet'), account='testing', sheet='StartA1')
     assert np.array_equal(dset.metadata.header, gsheet_header)
@@ -361,8 +357,7 @@ def test_gsheet_pathlib():
 
 
 @skipif_32bit_py27
-@skipif_no_gdrive_readonly
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('dr', 'sr')
 def test_gsheet_file_pointer():
     filename = 'table.gsheet'
     with open(filename, mode='w'):
@@ -388,7 +383,7 @@ def test_gsheet_file_pointer():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_as_datetime():
     # ID of the table.gsheet file
     table_id = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'
@@ -405,7 +400,7 @@ def test_gsheets_as_datetime():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_all_data():
     # ID of the table.gsheet file
     table_id = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ'
@@ -441,7 +436,7 @@ def test_gsheets_all_data():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_one_row():
     # ID of the table.gsheet file
     file = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'
@@ -451,7 +446,7 @@ def test_gsheets_one_row():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_one_column():
     # ID of the table.gsheet file
     file = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'
@@ -461,7 +456,7 @@ def test_gsheets_one_column():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_header_only():
     # ID of the table.gsheet file
     file = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'
@@ -471,7 +466,7 @@ def test_gsheets_header_only():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_empty():
     # ID of the table.gsheet file
     file = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'
@@ -481,7 +476,7 @@ def test_gsheets_empty():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheets_cell_range():
     # ID of the table.gsheet file
     file = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'
@@ -516,7 +511,7 @@ def test_gsheets_cell_range():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheet_range_out_of_bounds():
     for c in ['A100', 'J1:M10']:
         dset = read_table('1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet',
@@ -531,7 +526,7 @@ def test_gsheet_range_out_of_bounds():
 
 
 @skipif_32bit_py27
-@skipif_no_sheets_readonly
+@pytest.mark.usefixtures('sr')
 def test_gsheet_raises():
 
     ssid = '1Q0TAgnw6AJQWkLMf8V3qEhEXuCEXTFAc95cEcshOXnQ.gsheet'